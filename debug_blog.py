@@ -112,9 +112,9 @@ def analyze_blog(blog_name_or_url: str):
 
     if result:
         print("✅ Automatic detection successful:")
-        print(f"   Title: {result['title']}")
-        print(f"   URL: {result['url']}")
-        print(f"   Confidence: {result['confidence']:.2f}")
+        print(f"   Title: {result.title}")
+        print(f"   URL: {result.url}")
+        print(f"   Confidence: {result.confidence:.2f}")
     else:
         print("❌ Automatic detection failed")
     print()
@@ -1,4 +1,9 @@
 """Personal RSS Updater - A robust blog monitoring and notification system."""
 
+import logging
+
+# Library use stays silent unless the caller configures logging (the CLI does)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = "0.1.0"
 __author__ = "Yonatan Lourie"
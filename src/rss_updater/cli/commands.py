@@ -3,31 +3,37 @@
 import sys
 from pathlib import Path
 
-from ..core import load_config
-from ..storage import BlogStorage
-from ..initializer import initialize_blog_states
-from ..monitoring import (
-    analyze_failed_blogs,
-    analyze_blog_structure,
-    test_manual_selector,
-    BlogMonitor,
-)
-from ..feeds import FeedDetector, FeedValidator, HybridBlogMonitor
-from ..notification import EmailNotifier
-
 
 class CommandHandler:
-    """Handles execution of different CLI commands."""
+    """
+    Handles execution of different CLI commands.
+
+    Package modules are imported inside each handler so a command only pays
+    for the dependencies (requests, bs4, pydantic, smtplib...) it actually uses.
+    """
 
     def __init__(self, args):
         """Initialize command handler with parsed arguments."""
         self.args = args
 
+    def _load_config(self):
+        """Load configuration, applying the --parallel override if given."""
+        from ..core import load_config
+
+        config = load_config()
+        if self.args.parallel:
+            config.max_concurrency = self.args.parallel
+        return config
+
     def handle_init(self) -> None:
         """Handle blog initialization command."""
         print("\n=== INITIALIZATION MODE ===")
+        from ..initializer import initialize_blog_states
+
         try:
-            initialize_blog_states(mark_as_read=self.args.mark_as_read)
+            initialize_blog_states(
+                mark_as_read=self.args.mark_as_read, max_workers=self.args.parallel or 16
+            )
             print("Blog initialization completed successfully!")
         except Exception as e:
             print(f"Initialization failed: {e}")
@@ -36,6 +42,9 @@ class CommandHandler:
     def handle_sync(self) -> None:
         """Handle blog sync command."""
         print("\n=== SYNC MODE ===")
+        from ..core import load_config
+        from ..storage import BlogStorage
+
         try:
             # Load config and storage
             load_config()  # Load config for initialization
@@ -49,10 +58,9 @@ class CommandHandler:
                 blogs_file = Path("blogs.json")  # Fallback to old location
 
             if blogs_file.exists():
-                import json
+                from ..utils import read_json
 
-                with open(blogs_file, "r") as f:
-                    blogs = json.load(f)
+                blogs = read_json(blogs_file)
 
                 # Sync with storage
                 storage.sync_with_blogs(blogs)
@@ -69,6 +77,8 @@ class CommandHandler:
     def handle_analyze(self) -> None:
         """Handle blog analysis command."""
         print("\n=== ANALYSIS MODE ===")
+        from ..monitoring import analyze_failed_blogs, analyze_blog_structure
+
         try:
             if self.args.url and self.args.blog_name:
                 analyze_blog_structure(self.args.url, self.args.blog_name)
@@ -85,6 +95,8 @@ class CommandHandler:
             sys.exit(1)
 
         print(f"\n=== TESTING SELECTOR: {self.args.selector} ===")
+        from ..monitoring import test_manual_selector
+
         try:
             test_manual_selector(self.args.url, self.args.selector)
         except Exception as e:
@@ -94,9 +106,11 @@ class CommandHandler:
     def handle_check(self) -> None:
         """Handle blog checking without email."""
         print("\n=== CHECK MODE (No email) ===")
+        from ..monitoring import BlogMonitor
+
         try:
             # Load configuration
-            config = load_config()
+            config = self._load_config()
             # Initialize monitoring
             monitor = BlogMonitor(config)
 
@@ -124,6 +138,9 @@ class CommandHandler:
     def handle_test_email(self) -> None:
         """Handle email testing command."""
         print("\n=== EMAIL TEST MODE ===")
+        from ..core import load_config
+        from ..notification import EmailNotifier
+
         try:
             config = load_config()
             if not config.email.username or not config.email.password:
@@ -154,6 +171,8 @@ class CommandHandler:
             sys.exit(1)
 
         print(f"\n=== DETECTING FEEDS FOR: {self.args.url} ===")
+        from ..feeds import FeedDetector
+
         try:
             detector = FeedDetector()
             feeds = detector.detect_feeds(self.args.url)
@@ -175,9 +194,11 @@ class CommandHandler:
             sys.exit(1)
 
         print(f"\n=== VALIDATING FEED: {self.args.url} ===")
+        from ..feeds import FeedValidator
+
         try:
-            validator = FeedValidator()
-            health = validator.validate_feed(self.args.url)
+            with FeedValidator() as validator:
+                health = validator.validate_feed(self.args.url)
 
             print(f"Feed URL: {health.url}")
             print(f"Valid: {'✅' if health.is_valid else '❌'}")
@@ -210,8 +231,10 @@ class CommandHandler:
     def handle_hybrid_check(self) -> None:
         """Handle hybrid monitoring (RSS + scraping fallback)."""
         print("\n=== HYBRID CHECK MODE ===")
+        from ..feeds import HybridBlogMonitor
+
         try:
-            config = load_config()
+            config = self._load_config()
             monitor = HybridBlogMonitor(config)
 
             # Run hybrid monitoring
@@ -235,15 +258,21 @@ class CommandHandler:
     def handle_run(self) -> None:
         """Handle main run command."""
         print("\n=== MONITORING MODE ===")
+        from ..notification import EmailNotifier
+
         try:
-            config = load_config()
+            config = self._load_config()
 
             if self.args.use_hybrid:
                 # Use hybrid monitoring
+                from ..feeds import HybridBlogMonitor
+
                 monitor = HybridBlogMonitor(config)
                 results = monitor.check_all_blogs()
             else:
                 # Use traditional scraping
+                from ..monitoring import BlogMonitor
+
                 monitor = BlogMonitor(config)
                 results = monitor.check_all_blogs()
 
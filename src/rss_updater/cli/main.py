@@ -3,15 +3,20 @@
 import sys
 import argparse
 from typing import NoReturn
-from dotenv import load_dotenv
 
 from .commands import CommandHandler
+from ..utils import configure_logging
 
 
 def main() -> NoReturn:
     """Main entry point for the RSS updater application."""
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from .env file (optional at runtime)
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        pass
+    else:
+        load_dotenv()
 
     parser = argparse.ArgumentParser(description="Personal RSS Updater")
     parser.add_argument(
@@ -48,7 +53,16 @@ def main() -> NoReturn:
         help="Use hybrid mode (RSS + scraping fallback) for run command",
     )
 
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        help="Number of blogs/hosts fetched concurrently (default: max_concurrency from config, "
+        "16 for init)",
+    )
+
     args = parser.parse_args()
+    configure_logging()
 
     print("RSS Updater starting...")
     print("Personal RSS Updater v0.1.0")
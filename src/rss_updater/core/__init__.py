@@ -1,6 +1,14 @@
 """Core functionality for RSS updater."""
 
 from .config import AppConfig, EmailConfig, load_config, create_sample_config
-from .models import Post
+from .models import Blog, DetectedPost, Post
 
-__all__ = ["AppConfig", "EmailConfig", "load_config", "create_sample_config", "Post"]
+__all__ = [
+    "AppConfig",
+    "EmailConfig",
+    "load_config",
+    "create_sample_config",
+    "Blog",
+    "DetectedPost",
+    "Post",
+]
@@ -1,6 +1,7 @@
 """Configuration management for the RSS updater application."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -49,6 +50,8 @@ class AppConfig(BaseModel):
     failure_threshold: int = 3
     user_agent: str = "Mozilla/5.0 (Personal RSS Updater)"
     request_delay: float = 1.0
+    max_concurrency: int = 8  # Hosts checked in parallel during monitoring
+    parse_processes: int = 0  # Worker processes for HTML parsing (0 = parse in fetch threads)
 
 
 def load_config(config_path: Optional[Path] = None) -> AppConfig:
@@ -59,8 +62,7 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config_data = yaml.safe_load(f)
+    config_data = _read_config_file(str(config_path), config_path.stat().st_mtime_ns)
 
     try:
         return AppConfig(**config_data)
@@ -68,6 +70,13 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
         raise ValueError(f"Invalid configuration: {e}")
 
 
+@lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int) -> Dict:
+    """Parse the YAML config, cached per file modification time."""
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
 def create_sample_config(config_path: Optional[Path] = None) -> None:
     """Create a sample configuration file."""
     if config_path is None:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Represents a blog post."""
 
@@ -17,6 +17,7 @@ class Post:
     content: Optional[str] = None
     published_date: Optional[datetime] = None  # For RSS feeds
     author: Optional[str] = None
+    guid: Optional[str] = None  # Feed entry GUID, when the post came from a feed
 
     def to_dict(self) -> Dict:
         """Convert post to dictionary for JSON serialization."""
@@ -29,6 +30,7 @@ class Post:
             "content": self.content,
             "published_date": self.published_date.isoformat() if self.published_date else None,
             "author": self.author,
+            "guid": self.guid,
         }
 
     @classmethod
@@ -57,10 +59,40 @@ class Post:
             content=data.get("content"),
             published_date=published_date,
             author=data.get("author"),
+            guid=data.get("guid"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class DetectedPost:
+    """Latest post found on a blog page by selector detection."""
+
+    title: str
+    url: str
+    selector: str
+    confidence: float
+
+    def to_dict(self) -> Dict:
+        """Convert detected post to dictionary for JSON serialization."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "selector": self.selector,
+            "confidence": self.confidence,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DetectedPost":
+        """Create detected post from dictionary (JSON deserialization)."""
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            selector=data.get("selector", ""),
+            confidence=data.get("confidence", 0.0),
+        )
+
+
+@dataclass(slots=True)
 class Blog:
     """Represents a blog configuration."""
 
@@ -1,6 +1,5 @@
 """Main selector detector class."""
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
@@ -9,7 +8,33 @@ from .selector_candidate import SelectorCandidate
 from .pattern_detector import PatternDetector
 from .content_analyzer import ContentAnalyzer
 from .post_extractor import PostExtractor
-from ..utils import get_domain
+from ..core.models import DetectedPost
+from ..utils import content_hash, get_domain, post_fingerprint, read_json
+
+# Selectors for hosted blog platforms with stable markup, keyed by host suffix.
+# They are tried before automatic detection, which remains the fallback, and for a
+# blog with a stored post they are only trusted when they find that same post.
+PLATFORM_SELECTORS = {
+    "substack.com": {
+        "post_container": ".post-preview",
+        "title_selector": ".post-preview-title",
+        "link_selector": "a.post-preview-title",
+    },
+    "ghost.io": {
+        "post_container": "article.post-card",
+        "title_selector": ".post-card-title",
+        "link_selector": "a.post-card-content-link",
+    },
+    "wordpress.com": {
+        "post_container": "article",
+        "title_selector": ".entry-title",
+        "link_selector": ".entry-title a",
+    },
+}
+
+# Part of every detection key; bump it when detection logic changes so pages
+# detected by older code are parsed again instead of reusing the stored post
+DETECTOR_VERSION = 1
 
 
 class SelectorDetector:
@@ -32,8 +57,7 @@ class SelectorDetector:
             return {}
 
         try:
-            with open(self.manual_selectors_file, "r") as f:
-                return json.load(f)
+            return read_json(self.manual_selectors_file)
         except Exception as e:
             print(f"Warning: Could not load manual selectors: {e}")
             return {}
@@ -55,6 +79,26 @@ class SelectorDetector:
 
         return None
 
+    def _get_platform_selector(self, url: str) -> Optional[Dict]:
+        """Get the known selectors for a blog hosted on a recognized platform."""
+        domain = get_domain(url)
+        for suffix, config in PLATFORM_SELECTORS.items():
+            if domain == suffix or domain.endswith("." + suffix):
+                return config
+        return None
+
+    def detection_key(self, base_url: str, blog_name: str = None) -> str:
+        """
+        Identify the detector version and selectors get_latest_post uses for a blog.
+
+        A stored detection is only reused while this key is unchanged, so editing
+        manual_selectors.json or bumping DETECTOR_VERSION forces a fresh detection.
+        """
+        config = self._get_manual_selector(base_url, blog_name) or self._get_platform_selector(
+            base_url
+        )
+        return content_hash(f"{DETECTOR_VERSION}:{config!r}".encode())
+
     def detect_post_selectors(self, soup: BeautifulSoup, base_url: str) -> List[SelectorCandidate]:
         """
         Detect potential post selectors on a page.
@@ -82,8 +126,12 @@ class SelectorDetector:
         return sorted(unique_candidates, key=lambda x: x.confidence, reverse=True)
 
     def get_latest_post(
-        self, soup: BeautifulSoup, base_url: str, blog_name: str = None
-    ) -> Optional[Dict[str, str]]:
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+        blog_name: str = None,
+        last_post_fingerprint: Optional[str] = None,
+    ) -> Optional[DetectedPost]:
         """
         Get the latest post from a page using manual selectors or automatic detection.
 
@@ -91,15 +139,30 @@ class SelectorDetector:
             soup: BeautifulSoup object of the page
             base_url: Base URL for resolving relative links
             blog_name: Optional blog name for manual selector lookup
+            last_post_fingerprint: Fingerprint of the blog's stored latest post, if any.
+                Platform selectors that disagree with it defer to automatic detection,
+                so blogs tracked before they existed keep seeing the same post
 
         Returns:
-            Dictionary with post info or None if not found
+            DetectedPost or None if not found
         """
         # First try manual selectors
         manual_config = self._get_manual_selector(base_url, blog_name)
         if manual_config:
             return self.post_extractor.extract_with_manual_selectors(soup, base_url, manual_config)
 
+        # Then known platform markup, skipping candidate scoring when it matches
+        platform_config = self._get_platform_selector(base_url)
+        if platform_config:
+            post = self.post_extractor.extract_with_manual_selectors(
+                soup, base_url, platform_config
+            )
+            if post and last_post_fingerprint in (
+                None,
+                post_fingerprint(post.title, post.url),
+            ):
+                return post
+
         # Fall back to automatic detection
         candidates = self.detect_post_selectors(soup, base_url)
 
@@ -120,12 +183,12 @@ class SelectorDetector:
         url = self.post_extractor.extract_post_url(latest_element, base_url)
 
         if title and len(title.strip()) > 5:  # Must have a reasonable title
-            return {
-                "title": title.strip(),
-                "url": url or base_url,
-                "selector": best_candidate.selector,
-                "confidence": best_candidate.confidence,
-            }
+            return DetectedPost(
+                title=title.strip(),
+                url=url or base_url,
+                selector=best_candidate.selector,
+                confidence=best_candidate.confidence,
+            )
 
         return None
 
@@ -1,9 +1,42 @@
 """Post extraction functionality."""
 
+import logging
 from typing import Optional, Dict, List
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from ..utils import clean_text, resolve_relative_url
-from ..core.models import Post
+from ..core.models import DetectedPost, Post
+
+logger = logging.getLogger(__name__)
+
+# Selectors compiled once at import; calling them directly skips bs4's per-call
+# selector lookup, which dominates on the small post elements checked here.
+_TITLE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        ".post-title",
+        ".entry-title",
+        ".title",
+        "a[href]",
+        ".headline",
+        ".header",
+    )
+)
+_LINK_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "h1 a[href]",
+        "h2 a[href]",
+        "h3 a[href]",
+        ".post-title a[href]",
+        ".entry-title a[href]",
+        "a[href]",
+    )
+)
 
 
 class PostExtractor:
@@ -12,21 +45,8 @@ class PostExtractor:
     def extract_post_title(self, element: Tag) -> Optional[str]:
         """Extract title from a post element."""
         # Try various title selectors in order of preference
-        title_selectors = [
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            ".post-title",
-            ".entry-title",
-            ".title",
-            "a[href]",
-            ".headline",
-            ".header",
-        ]
-
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
+        for selector in _TITLE_SELECTORS:
+            title_elem = selector.select_one(element)
             if title_elem:
                 title = clean_text(title_elem.get_text())
                 if len(title) > 5:  # Must be reasonable length
@@ -37,17 +57,8 @@ class PostExtractor:
     def extract_post_url(self, element: Tag, base_url: str) -> Optional[str]:
         """Extract URL from a post element."""
         # Look for links in order of preference
-        link_selectors = [
-            "h1 a[href]",
-            "h2 a[href]",
-            "h3 a[href]",
-            ".post-title a[href]",
-            ".entry-title a[href]",
-            "a[href]",
-        ]
-
-        for selector in link_selectors:
-            link_elem = element.select_one(selector)
+        for selector in _LINK_SELECTORS:
+            link_elem = selector.select_one(element)
             if link_elem and link_elem.get("href"):
                 href = link_elem.get("href")
                 if self._is_internal_link(href, base_url):
@@ -57,7 +68,7 @@ class PostExtractor:
 
     def extract_with_manual_selectors(
         self, soup: BeautifulSoup, base_url: str, config: Dict
-    ) -> Optional[Dict[str, str]]:
+    ) -> Optional[DetectedPost]:
         """Extract latest post using manual selector configuration."""
         try:
             post_container = config.get("post_container")
@@ -67,7 +78,7 @@ class PostExtractor:
             # Find post containers
             containers = soup.select(post_container)
             if not containers:
-                print(f"  - Manual selector '{post_container}' found no containers")
+                logger.info("  - Manual selector '%s' found no containers", post_container)
                 return None
 
             # Get the first (latest) container
@@ -109,17 +120,17 @@ class PostExtractor:
                     post_url = resolve_relative_url(base_url, link_elem.get("href"))
 
             if title and len(title.strip()) > 5:
-                return {
-                    "title": title.strip(),
-                    "url": post_url,
-                    "selector": f"Manual: {post_container}",
-                    "confidence": 1.0,  # Manual selectors get full confidence
-                }
+                return DetectedPost(
+                    title=title.strip(),
+                    url=post_url,
+                    selector=f"Manual: {post_container}",
+                    confidence=1.0,  # Manual selectors get full confidence
+                )
 
             return None
 
         except Exception as e:
-            print(f"  - Error with manual selectors: {e}")
+            logger.warning("  - Error with manual selectors: %s", e)
             return None
 
     def _is_internal_link(self, href: str, base_url: str) -> bool:
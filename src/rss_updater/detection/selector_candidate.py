@@ -1,9 +1,26 @@
 """Selector candidate class for blog post detection."""
 
 from typing import List
+import soupsieve
 from bs4 import Tag
 from ..utils import clean_text
 
+# Title selectors in order of preference, compiled once at import
+_TITLE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in (
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        ".title",
+        ".post-title",
+        ".entry-title",
+        "a",
+        ".link",
+    )
+)
+
 
 class SelectorCandidate:
     """Represents a potential CSS selector for blog posts."""
@@ -17,20 +34,8 @@ class SelectorCandidate:
     def _extract_title(self, element: Tag) -> str:
         """Extract title from an element."""
         # Try various title extraction methods
-        title_selectors = [
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            ".title",
-            ".post-title",
-            ".entry-title",
-            "a",
-            ".link",
-        ]
-
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
+        for selector in _TITLE_SELECTORS:
+            title_elem = selector.select_one(element)
             if title_elem:
                 title = clean_text(title_elem.get_text())
                 if len(title) > 10:  # Reasonable title length
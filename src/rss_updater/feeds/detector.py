@@ -1,10 +1,18 @@
 """RSS/Atom feed auto-detection functionality."""
 
+import logging
 import re
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..web import FEED_BACKOFF_FACTOR, FEED_RETRY_TOTAL, create_session
+
+logger = logging.getLogger(__name__)
+
+# Feed discovery only looks at <link> and <a> tags, so the rest of the page is not built
+_FEED_LINK_TAGS = SoupStrainer(["link", "a"])
 
 
 class FeedDetector:
@@ -38,10 +46,18 @@ class FeedDetector:
         "application/rdf+xml",
     }
 
-    def __init__(self, user_agent: str = "Mozilla/5.0 (Personal RSS Updater)", timeout: int = 10):
-        """Initialize feed detector."""
+    def __init__(
+        self,
+        user_agent: str = "Mozilla/5.0 (Personal RSS Updater)",
+        timeout: int = 10,
+        session: Optional[requests.Session] = None,
+    ):
+        """Initialize feed detector, optionally sharing an existing HTTP session."""
         self.user_agent = user_agent
         self.timeout = timeout
+        self.session = session or create_session(
+            user_agent, retry_total=FEED_RETRY_TOTAL, backoff_factor=FEED_BACKOFF_FACTOR
+        )
 
     def detect_feeds(self, url: str) -> List[str]:
         """
@@ -76,12 +92,10 @@ class FeedDetector:
         feeds = []
 
         try:
-            response = requests.get(
-                url, headers={"User-Agent": self.user_agent}, timeout=self.timeout
-            )
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "lxml")
+            soup = BeautifulSoup(response.content, "lxml", parse_only=_FEED_LINK_TAGS)
 
             # Look for RSS/Atom feed links in HTML head
             feed_links = soup.find_all("link", rel=re.compile(r"alternate", re.I))
@@ -106,7 +120,7 @@ class FeedDetector:
                         feeds.append(feed_url)
 
         except Exception as e:
-            print(f"Error detecting feeds from HTML for {url}: {e}")
+            logger.warning("Error detecting feeds from HTML for %s: %s", url, e)
 
         return feeds
 
@@ -120,12 +134,7 @@ class FeedDetector:
 
             # Quick HEAD request to check if feed exists
             try:
-                response = requests.head(
-                    feed_url,
-                    headers={"User-Agent": self.user_agent},
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                )
+                response = self.session.head(feed_url, timeout=self.timeout, allow_redirects=True)
 
                 if response.status_code == 200:
                     content_type = response.headers.get("content-type", "").lower()
@@ -141,9 +150,7 @@ class FeedDetector:
     def _is_valid_feed(self, url: str) -> bool:
         """Validate if URL points to a valid RSS/Atom feed."""
         try:
-            response = requests.get(
-                url, headers={"User-Agent": self.user_agent}, timeout=self.timeout
-            )
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
             # Check content type
@@ -151,14 +158,15 @@ class FeedDetector:
             if any(mime_type in content_type for mime_type in self.FEED_MIME_TYPES):
                 return True
 
-            # Check content for feed indicators
-            content = response.text.lower()
+            # Check content for feed indicators; the markers are ASCII, so search the raw
+            # bytes rather than decoding (response.text would run charset detection)
+            content = response.content.lower()
             feed_indicators = [
-                "<rss",
-                "<feed",
-                "<rdf:rdf",
-                "xmlns:atom",
-                'xmlns="http://www.w3.org/2005/atom"',
+                b"<rss",
+                b"<feed",
+                b"<rdf:rdf",
+                b"xmlns:atom",
+                b'xmlns="http://www.w3.org/2005/atom"',
             ]
 
             return any(indicator in content for indicator in feed_indicators)
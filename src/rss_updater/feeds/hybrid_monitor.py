@@ -1,16 +1,28 @@
 """Hybrid monitoring system that tries RSS first, then falls back to web scraping."""
 
-from typing import Optional, Dict, List
-from datetime import datetime
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Mapping, Sequence
+from datetime import datetime, timezone
 from ..core import Post, AppConfig
-from ..web import WebScraper
+from ..web import FEED_BACKOFF_FACTOR, FEED_RETRY_TOTAL, WebScraper, create_session
 from ..detection import SelectorDetector
 from ..storage import BlogStorage
-from ..utils import clean_text
+from ..utils import group_by_host, post_fingerprint, read_json_cached
 from .parser import FeedParser
 from .detector import FeedDetector
 from .validator import FeedValidator
 
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return value as an aware UTC datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 
 class HybridBlogMonitor:
     """
@@ -28,14 +40,28 @@ class HybridBlogMonitor:
         self.config = config
         self.storage = storage or BlogStorage()
 
+        # One pooled session shared by every HTTP client below, sized for the worker threads
+        self.session = create_session(
+            self.config.user_agent,
+            pool_maxsize=max(1, self.config.max_concurrency),
+            retry_total=FEED_RETRY_TOTAL,
+            backoff_factor=FEED_BACKOFF_FACTOR,
+        )
+
         # Web scraping components (fallback)
         self.web_scraper = None
         self.selector_detector = SelectorDetector()
 
         # RSS/Feed components (primary)
-        self.feed_parser = FeedParser(user_agent=self.config.user_agent, timeout=30)
-        self.feed_detector = FeedDetector(user_agent=self.config.user_agent, timeout=10)
-        self.feed_validator = FeedValidator(user_agent=self.config.user_agent, timeout=30)
+        self.feed_parser = FeedParser(
+            user_agent=self.config.user_agent, timeout=30, session=self.session
+        )
+        self.feed_detector = FeedDetector(
+            user_agent=self.config.user_agent, timeout=10, session=self.session
+        )
+        self.feed_validator = FeedValidator(
+            user_agent=self.config.user_agent, timeout=30, session=self.session
+        )
 
         self.stats = {
             "total_blogs": 0,
@@ -47,6 +73,8 @@ class HybridBlogMonitor:
             "errors": [],
         }
         self.new_posts: List[Post] = []
+        self._lock = threading.Lock()  # Guards stats/new_posts across host workers
+        self._checked_count = 0
 
     def check_blog(self, blog_name: str, blog_url: str) -> Optional[Post]:
         """
@@ -65,24 +93,28 @@ class HybridBlogMonitor:
         try:
             rss_post = self._check_blog_via_rss(blog_name, blog_url, current_state)
             if rss_post:
-                self.stats["rss_success"] += 1
-                print("  📡 RSS: Found via feed")
+                with self._lock:
+                    self.stats["rss_success"] += 1
+                logger.info("  📡 RSS: Found via feed")
                 return rss_post
         except Exception as e:
-            print(f"  📡 RSS: Failed ({e}), trying web scraping...")
+            logger.info("  📡 RSS: Failed (%s), trying web scraping...", e)
 
         # Fallback to web scraping
         try:
             if not self.web_scraper:
-                self.web_scraper = WebScraper(user_agent=self.config.user_agent)
+                self.web_scraper = WebScraper(
+                    user_agent=self.config.user_agent, session=self.session
+                )
 
             scraper_post = self._check_blog_via_scraping(blog_name, blog_url, current_state)
             if scraper_post:
-                self.stats["scraper_fallback"] += 1
-                print("  🔍 SCRAPER: Found via web scraping")
+                with self._lock:
+                    self.stats["scraper_fallback"] += 1
+                logger.info("  🔍 SCRAPER: Found via web scraping")
                 return scraper_post
         except Exception as e:
-            print(f"  🔍 SCRAPER: Failed ({e})")
+            logger.warning("  🔍 SCRAPER: Failed (%s)", e)
             raise e
 
         return None
@@ -122,15 +154,16 @@ class HybridBlogMonitor:
             raise Exception("RSS feed has no entries")
 
         # Get latest entry
-        latest_entry = max(feed.entries, key=lambda e: e.published or datetime.min)
+        latest_entry = feed.latest_entry()
 
         # Convert to Post object
         latest_post = Post(
             title=latest_entry.title,
-            url=str(latest_entry.link),
+            url=latest_entry.link,
             blog_name=blog_name,
             content=latest_entry.description or latest_entry.content,
             published_date=latest_entry.published,
+            guid=latest_entry.guid,
         )
 
         # Check if this is a new post
@@ -149,29 +182,50 @@ class HybridBlogMonitor:
     ) -> Optional[Post]:
         """Check blog via web scraping (fallback method)."""
 
-        # Fetch and parse the page
-        soup = self.web_scraper.fetch_and_parse(blog_url)
+        # Fetch the page, conditionally if an earlier check saw it unchanged
+        response = self.web_scraper.fetch_page(
+            blog_url,
+            etag=current_state.page_etag if current_state else None,
+            last_modified=current_state.page_last_modified if current_state else None,
+        )
+        if response is None:
+            raise Exception("Failed to fetch page")
+
+        if response.status_code == 304:
+            return None
+
+        soup = self.web_scraper.parse_page(response)
         if not soup:
             raise Exception("Failed to fetch page")
 
         # Get latest post using intelligent detection
-        latest_post_info = self.selector_detector.get_latest_post(soup, blog_url, blog_name)
+        latest_post_info = self.selector_detector.get_latest_post(
+            soup,
+            blog_url,
+            blog_name,
+            current_state.last_post_fingerprint if current_state else None,
+        )
         if not latest_post_info:
             raise Exception("Could not detect any posts")
 
         # Create Post object
         latest_post = Post(
-            title=latest_post_info["title"], url=latest_post_info["url"], blog_name=blog_name
+            title=latest_post_info.title, url=latest_post_info.url, blog_name=blog_name
         )
 
         # Check if this is a new post
         is_new = self._is_new_post(latest_post, current_state, method="scraping")
 
         if is_new:
+            # New posts are re-detected until notified, so drop any stored validators
+            self.storage.update_page_validators(blog_name, None, None)
             # Only reset failure count (don't update latest post yet)
             self.storage.reset_failure_count(blog_name)
             return latest_post
 
+        self.storage.update_page_validators(
+            blog_name, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
         return None
 
     def _is_new_post(self, latest_post: Post, current_state, method: str) -> bool:
@@ -189,16 +243,25 @@ class HybridBlogMonitor:
         if stored_title and stored_title.startswith("Fallback -"):
             return True
 
+        # A matching feed GUID identifies the same post without comparing text. A different
+        # GUID is not conclusive, since some feeds rotate or regenerate them for old posts
+        if latest_post.guid and latest_post.guid == current_state.last_post_guid:
+            return False
+
         # For RSS method, also compare by publication date if available
         if method == "rss" and latest_post.published_date and current_state.last_post_date:
-            if latest_post.published_date <= current_state.last_post_date:
+            # Feed dates are timezone-aware; stored dates may be naive
+            if _as_utc(latest_post.published_date) <= _as_utc(current_state.last_post_date):
                 return False
 
-        # Compare title and URL
-        title_different = clean_text(latest_post.title) != clean_text(stored_title or "")
-        url_different = latest_post.url != stored_url
+        # A permalink recorded earlier is an old post resurfacing (e.g. a pinned post)
+        if current_state.has_seen_url(latest_post.url):
+            return False
 
-        return title_different or url_different
+        # Compare title and URL: new if either differs
+        return post_fingerprint(latest_post.title, latest_post.url) != (
+            current_state.last_post_fingerprint
+        )
 
     def _get_cached_feed_url(self, blog_name: str, blog_url: str) -> Optional[str]:
         """Get cached RSS feed URL for a blog."""
@@ -225,58 +288,83 @@ class HybridBlogMonitor:
 
     def check_all_blogs(self) -> Dict:
         """Check all blogs using hybrid approach."""
-        print("Starting hybrid blog monitoring (RSS + Web Scraping)...")
+        logger.info("Starting hybrid blog monitoring (RSS + Web Scraping)...")
 
         blogs = self._load_blogs()
         self.stats["total_blogs"] = len(blogs)
 
-        print(f"Checking {len(blogs)} blogs for new posts...")
+        logger.info("Checking %d blogs for new posts...", len(blogs))
+
+        if not self.web_scraper:
+            self.web_scraper = WebScraper(user_agent=self.config.user_agent, session=self.session)
+
+        # One worker per host: blogs on the same host are checked serially so a
+        # host never sees parallel requests from us, while different hosts overlap.
+        # Per-blog feed cache updates are batched into a single write at the end.
+        host_groups = group_by_host(blogs)
+        max_workers = max(1, min(self.config.max_concurrency, len(host_groups)))
+        with self.storage.batch(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._check_host_blogs, host_blogs, len(blogs))
+                for host_blogs in host_groups.values()
+            ]
+            for future in futures:
+                future.result()
+
+            # Save updated states
+            self.storage.save()
 
-        for i, blog in enumerate(blogs, 1):
+        # Clean up web scraper and the shared session
+        if self.web_scraper:
+            self.web_scraper.close()
+        self.session.close()
+
+        logger.info("\nMonitoring complete!")
+        logger.info("✅ Checked: %d/%d", self.stats["checked_blogs"], self.stats["total_blogs"])
+        logger.info("📡 RSS Success: %d", self.stats["rss_success"])
+        logger.info("🔍 Scraper Fallback: %d", self.stats["scraper_fallback"])
+        logger.info("🎉 New posts: %d", self.stats["new_posts_found"])
+        logger.info("❌ Failures: %d", self.stats["failed_blogs"])
+
+        return {
+            "new_posts": self.new_posts,
+            "stats": self.stats,
+            "failed_blogs": self.storage.get_failed_blogs(self.config.failure_threshold),
+        }
+
+    def _check_host_blogs(self, blogs: List[Mapping[str, str]], total: int) -> None:
+        """Check blogs that share a host one after another."""
+        for blog in blogs:
             blog_name = blog["name"]
             blog_url = blog["url"]
 
-            print(f"[{i}/{len(blogs)}] Checking: {blog_name}")
+            with self._lock:
+                self._checked_count += 1
+                position = self._checked_count
+            logger.info("[%d/%d] Checking: %s", position, total, blog_name)
 
             try:
                 new_post = self.check_blog(blog_name, blog_url)
+                with self._lock:
+                    if new_post:
+                        self.new_posts.append(new_post)
+                        self.stats["new_posts_found"] += 1
+                    self.stats["checked_blogs"] += 1
+
                 if new_post:
-                    self.new_posts.append(new_post)
-                    self.stats["new_posts_found"] += 1
-                    print(f"  🎉 NEW POST: {new_post.title[:60]}...")
+                    logger.info("  🎉 NEW POST (%s): %s...", blog_name, new_post.title[:60])
                 else:
-                    print("  ✓ No new posts")
-
-                self.stats["checked_blogs"] += 1
+                    logger.info("  ✓ No new posts (%s)", blog_name)
 
             except Exception as e:
                 error_msg = f"Error checking {blog_name}: {e}"
-                print(f"  ❌ {error_msg}")
-                self.stats["errors"].append(error_msg)
-                self.stats["failed_blogs"] += 1
+                logger.warning("  ❌ %s", error_msg)
+                with self._lock:
+                    self.stats["errors"].append(error_msg)
+                    self.stats["failed_blogs"] += 1
 
                 self.storage.increment_failure_count(blog_name, blog_url)
 
-        # Clean up web scraper
-        if self.web_scraper:
-            self.web_scraper.close()
-
-        # Save updated states
-        self.storage.save()
-
-        print("\nMonitoring complete!")
-        print(f"✅ Checked: {self.stats['checked_blogs']}/{self.stats['total_blogs']}")
-        print(f"📡 RSS Success: {self.stats['rss_success']}")
-        print(f"🔍 Scraper Fallback: {self.stats['scraper_fallback']}")
-        print(f"🎉 New posts: {self.stats['new_posts_found']}")
-        print(f"❌ Failures: {self.stats['failed_blogs']}")
-
-        return {
-            "new_posts": self.new_posts,
-            "stats": self.stats,
-            "failed_blogs": self.storage.get_failed_blogs(self.config.failure_threshold),
-        }
-
     def mark_posts_as_notified(self, new_posts: List[Post]) -> None:
         """
         Mark new posts as successfully notified by updating storage.
@@ -292,10 +380,8 @@ class HybridBlogMonitor:
         # Save the updated states to disk
         self.storage.save()
 
-    def _load_blogs(self) -> List[Dict[str, str]]:
-        """Load blog list from JSON file."""
-        import json
-
+    def _load_blogs(self) -> Sequence[Mapping[str, str]]:
+        """Load blog list from JSON file (read-only: shared through read_json_cached)."""
         from ..constants import BLOGS_CONFIG_PATH, LEGACY_BLOGS_PATH
 
         blogs_file = BLOGS_CONFIG_PATH if BLOGS_CONFIG_PATH.exists() else LEGACY_BLOGS_PATH
@@ -303,10 +389,7 @@ class HybridBlogMonitor:
         if not blogs_file.exists():
             raise FileNotFoundError(f"Blog list file not found: {blogs_file}")
 
-        with open(blogs_file, "r") as f:
-            blogs = json.load(f)
-
-        return blogs
+        return read_json_cached(blogs_file)
 
     def get_summary(self) -> str:
         """Get text summary of monitoring results."""
@@ -349,10 +432,11 @@ class HybridBlogMonitor:
         summary.append(f"\n⚠️  Persistently Failed Blogs ({len(failed_blogs)}):")
         summary.append("=" * 40)
 
+        now = datetime.now()
         for blog_name, state in failed_blogs.items():
             days_failed = "Unknown"
             if state.last_success:
-                days_failed = (datetime.now() - state.last_success).days
+                days_failed = (now - state.last_success).days
 
             summary.append(f"• {blog_name}")
             summary.append(f"  Failures: {state.failure_count}")
@@ -9,7 +9,7 @@ class FeedEntry(BaseModel):
     """Represents a single feed entry/post."""
 
     title: str
-    link: HttpUrl
+    link: str  # Checked for an http(s) scheme by the parser; HttpUrl is too slow per entry
     description: Optional[str] = None
     published: Optional[datetime] = None
     guid: Optional[str] = None
@@ -33,6 +33,31 @@ class Feed(BaseModel):
     entries: List[FeedEntry] = Field(default_factory=list)
     feed_type: Optional[str] = None  # 'rss', 'atom', etc.
     version: Optional[str] = None  # RSS version or Atom version
+    latest_index: Optional[int] = None  # Index of newest entry, computed while parsing
+
+    def latest_entry(self) -> Optional[FeedEntry]:
+        """Return the most recently published entry (first entry if none are dated)."""
+        if not self.entries:
+            return None
+
+        if self.latest_index is None:
+            self.latest_index = _latest_entry_index(self.entries)
+
+        return self.entries[self.latest_index]
 
     def __str__(self) -> str:
         return f"{self.title} ({len(self.entries)} entries)"
+
+
+def _latest_entry_index(entries: List[FeedEntry]) -> int:
+    """Find the index of the newest dated entry in a single pass."""
+    latest_index = 0
+    latest_published = None
+
+    for index, entry in enumerate(entries):
+        published = entry.published
+        if published is not None and (latest_published is None or published > latest_published):
+            latest_index = index
+            latest_published = published
+
+    return latest_index
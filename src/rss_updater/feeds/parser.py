@@ -1,19 +1,37 @@
 """RSS/Atom feed parsing functionality."""
 
+import calendar
+import logging
 import feedparser
-from typing import Optional
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+import requests
+from typing import Mapping, Optional
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate, parsedate_to_datetime
 from .models import Feed, FeedEntry
 
+logger = logging.getLogger(__name__)
+
 
 class FeedParser:
     """Parser for RSS and Atom feeds."""
 
-    def __init__(self, user_agent: str = "Mozilla/5.0 (Personal RSS Updater)", timeout: int = 30):
-        """Initialize feed parser."""
+    def __init__(
+        self,
+        user_agent: str = "Mozilla/5.0 (Personal RSS Updater)",
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize feed parser.
+
+        Args:
+            user_agent: User-Agent header for feed requests
+            timeout: Request timeout in seconds
+            session: Optional shared session; without one feedparser fetches URLs itself
+        """
         self.user_agent = user_agent
         self.timeout = timeout
+        self.session = session
 
     def parse_feed(
         self, url: str, etag: Optional[str] = None, modified: Optional[datetime] = None
@@ -30,7 +48,8 @@ class FeedParser:
             Feed object or None if parsing failed
         """
         try:
-            # Use feedparser's built-in conditional request support
+            if self.session is not None:
+                return self._fetch_with_session(url, etag, modified)
 
             # Use feedparser's built-in conditional request support
             kwargs = {
@@ -40,68 +59,144 @@ class FeedParser:
 
             # Parse the feed
             parsed = feedparser.parse(url, **{k: v for k, v in kwargs.items() if v is not None})
+            return self._build_feed(parsed, url)
 
-            # Check if feed was modified (not cached)
-            if hasattr(parsed, "status"):
-                if parsed.status == 304:  # Not Modified
-                    return None
-                elif parsed.status >= 400:  # Error
-                    print(f"HTTP error {parsed.status} parsing feed {url}")
-                    return None
-
-            # Check for feed parsing errors
-            if hasattr(parsed, "bozo") and parsed.bozo:
-                if hasattr(parsed, "bozo_exception"):
-                    print(f"Feed parsing warning for {url}: {parsed.bozo_exception}")
-
-            # Extract feed metadata
-            feed_info = parsed.feed
-
-            feed_data = {
-                "title": self._get_text_content(feed_info.get("title", "Untitled Feed")),
-                "link": feed_info.get("link", url),
-                "description": self._get_text_content(feed_info.get("description", "")),
-                "language": feed_info.get("language"),
-                "entries": [],
-            }
+        except Exception as e:
+            logger.warning("Error parsing feed %s: %s", url, e)
+            return None
 
-            # Add caching headers
-            if hasattr(parsed, "etag"):
-                feed_data["etag"] = parsed.etag
-            if hasattr(parsed, "modified"):
-                feed_data["modified"] = datetime(*parsed.modified[:6]) if parsed.modified else None
-
-            # Detect feed type and version
-            if hasattr(parsed, "version"):
-                feed_data["version"] = parsed.version
-                if "atom" in parsed.version.lower():
-                    feed_data["feed_type"] = "atom"
-                elif "rss" in parsed.version.lower():
-                    feed_data["feed_type"] = "rss"
-                else:
-                    feed_data["feed_type"] = "unknown"
+    def parse_feed_bytes(
+        self, body: bytes, url: str, headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[Feed]:
+        """
+        Parse an RSS/Atom feed body that has already been downloaded.
 
-            # Parse entries
-            for entry in parsed.entries:
-                feed_entry = self._parse_entry(entry)
-                if feed_entry:
-                    feed_data["entries"].append(feed_entry)
+        Args:
+            body: Raw feed bytes
+            url: URL the feed was fetched from
+            headers: Response headers, used for encoding and ETag/Last-Modified
 
-            # Set last updated time
-            feed_data["last_updated"] = datetime.utcnow()
+        Returns:
+            Feed object or None if parsing failed
+        """
+        try:
+            headers = headers or {}
+            parsed = feedparser.parse(
+                body, response_headers={key.lower(): value for key, value in headers.items()}
+            )
+            parsed["href"] = url
+
+            for key, value in headers.items():
+                if key.lower() == "etag" and value:
+                    parsed["etag"] = value
+                elif key.lower() == "last-modified" and value:
+                    parsed["modified"] = value
+                    parsed["modified_parsed"] = parsedate(value)
 
-            return Feed(**feed_data)
+            return self._build_feed(parsed, url)
 
         except Exception as e:
-            print(f"Error parsing feed {url}: {e}")
+            logger.warning("Error parsing feed %s: %s", url, e)
             return None
 
+    def _fetch_with_session(
+        self, url: str, etag: Optional[str], modified: Optional[datetime]
+    ) -> Optional[Feed]:
+        """Fetch a feed through the shared session and parse the body."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = formatdate(
+                calendar.timegm(modified.utctimetuple()), usegmt=True
+            )
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304:  # Not Modified
+            return None
+        if response.status_code >= 400:
+            logger.warning("HTTP error %d parsing feed %s", response.status_code, url)
+            return None
+
+        return self.parse_feed_bytes(response.content, response.url or url, response.headers)
+
+    def _build_feed(self, parsed, url: str) -> Optional[Feed]:
+        """Build a Feed from a feedparser result."""
+        # Check if feed was modified (not cached)
+        if hasattr(parsed, "status"):
+            if parsed.status == 304:  # Not Modified
+                return None
+            elif parsed.status >= 400:  # Error
+                logger.warning("HTTP error %s parsing feed %s", parsed.status, url)
+                return None
+
+        # Check for feed parsing errors
+        if hasattr(parsed, "bozo") and parsed.bozo:
+            if hasattr(parsed, "bozo_exception"):
+                logger.warning("Feed parsing warning for %s: %s", url, parsed.bozo_exception)
+
+        # Extract feed metadata
+        feed_info = parsed.feed
+
+        feed_data = {
+            "title": self._get_text_content(feed_info.get("title", "Untitled Feed")),
+            "link": feed_info.get("link", url),
+            "description": self._get_text_content(feed_info.get("description", "")),
+            "language": feed_info.get("language"),
+            "entries": [],
+        }
+
+        # Add caching headers
+        if hasattr(parsed, "etag"):
+            feed_data["etag"] = parsed.etag
+        modified_parsed = getattr(parsed, "modified_parsed", None)
+        if modified_parsed:
+            feed_data["modified"] = datetime(*modified_parsed[:6])
+
+        # Detect feed type and version
+        if hasattr(parsed, "version"):
+            feed_data["version"] = parsed.version
+            if "atom" in parsed.version.lower():
+                feed_data["feed_type"] = "atom"
+            elif "rss" in parsed.version.lower():
+                feed_data["feed_type"] = "rss"
+            else:
+                feed_data["feed_type"] = "unknown"
+
+        # Parse entries, tracking the newest one as we go
+        entries = feed_data["entries"]
+        latest_index = None
+        latest_published = None
+        for entry in parsed.entries:
+            feed_entry = self._parse_entry(entry)
+            if feed_entry:
+                published = feed_entry.published
+                if latest_index is None or (
+                    published is not None
+                    and (latest_published is None or published > latest_published)
+                ):
+                    latest_index = len(entries)
+                    latest_published = published
+                entries.append(feed_entry)
+
+        feed_data["latest_index"] = latest_index
+
+        # Set last updated time
+        feed_data["last_updated"] = datetime.now(timezone.utc)
+
+        return Feed(**feed_data)
+
     def _parse_entry(self, entry) -> Optional[FeedEntry]:
         """Parse a single feed entry."""
         try:
+            link = entry.get("link", "")
+            if not isinstance(link, str) or not link.startswith(("http://", "https://")):
+                return None
+
             entry_data = {
                 "title": self._get_text_content(entry.get("title", "Untitled")),
-                "link": entry.get("link", ""),
+                "link": link,
             }
 
             # Handle description/summary/content
@@ -130,7 +225,8 @@ class FeedParser:
                     date_tuple = getattr(entry, date_field)
                     if date_tuple:
                         try:
-                            published_date = datetime(*date_tuple[:6])
+                            # feedparser normalizes *_parsed tuples to UTC
+                            published_date = datetime(*date_tuple[:6], tzinfo=timezone.utc)
                             break
                         except (ValueError, TypeError):
                             continue
@@ -143,6 +239,10 @@ class FeedParser:
                         if date_str:
                             try:
                                 published_date = parsedate_to_datetime(date_str)
+                                if published_date.tzinfo is None:
+                                    published_date = published_date.replace(tzinfo=timezone.utc)
+                                else:
+                                    published_date = published_date.astimezone(timezone.utc)
                                 break
                             except (ValueError, TypeError):
                                 continue
@@ -171,7 +271,7 @@ class FeedParser:
             return FeedEntry(**entry_data)
 
         except Exception as e:
-            print(f"Error parsing feed entry: {e}")
+            logger.warning("Error parsing feed entry: %s", e)
             return None
 
     def _get_text_content(self, content) -> str:
@@ -1,11 +1,17 @@
 """Feed validation and health check functionality."""
 
+import logging
+import re
 import time
-from typing import Dict, List, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime, timezone
 from dataclasses import dataclass
 import requests
 from .parser import FeedParser
+from ..web import FEED_BACKOFF_FACTOR, FEED_RETRY_TOTAL, create_session
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -36,36 +42,81 @@ class FeedHealth:
 class FeedValidator:
     """Validates RSS/Atom feeds and performs health checks."""
 
-    def __init__(self, timeout: int = 30, user_agent: str = "Mozilla/5.0 (Personal RSS Updater)"):
-        """Initialize feed validator."""
+    # Content types accepted as a feed (rss+xml, atom+xml, xml)
+    _CT_RE = re.compile(r"application/(?:rss\+xml|atom\+xml|xml)|text/xml", re.I)
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: str = "Mozilla/5.0 (Personal RSS Updater)",
+        session: Optional[requests.Session] = None,
+    ):
+        """Initialize feed validator, optionally sharing an existing HTTP session."""
         self.timeout = timeout
         self.user_agent = user_agent
-        self.parser = FeedParser(user_agent=user_agent, timeout=timeout)
+        # Own session is sized for validate_feeds so concurrent checks reuse connections
+        self._owns_session = session is None
+        self.session = session or create_session(
+            user_agent,
+            pool_maxsize=16,
+            retry_total=FEED_RETRY_TOTAL,
+            backoff_factor=FEED_BACKOFF_FACTOR,
+        )
+        self.parser = FeedParser(user_agent=user_agent, timeout=timeout, session=self.session)
+
+    def close(self) -> None:
+        """Close the HTTP session if this validator created it."""
+        if self._owns_session:
+            self.session.close()
 
-    def validate_feed(self, url: str) -> FeedHealth:
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def validate_feed(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> FeedHealth:
         """
         Perform comprehensive validation of a feed.
 
         Args:
             url: Feed URL to validate
+            etag: ETag from a previous validation, sent as If-None-Match
+            last_modified: Last-Modified from a previous validation, sent as If-Modified-Since
 
         Returns:
             FeedHealth object with validation results
         """
         health = FeedHealth(url=url, is_valid=False, is_reachable=False)
 
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         # Test basic connectivity
         start_time = time.time()
         try:
-            response = requests.get(
-                url,
-                headers={"User-Agent": self.user_agent},
-                timeout=self.timeout,
-                allow_redirects=True,
+            response = self.session.get(
+                url, headers=headers, timeout=self.timeout, allow_redirects=True
             )
 
             health.response_time = time.time() - start_time
             health.status_code = response.status_code
+
+            # Unchanged since the previous validation: trust that result and skip parsing
+            if response.status_code == 304:
+                health.is_reachable = True
+                health.is_valid = True
+                health.etag = response.headers.get("etag", etag)
+                health.last_modified = response.headers.get("last-modified", last_modified)
+                return health
+
             health.is_reachable = response.status_code == 200
 
             # Check for redirects
@@ -82,14 +133,7 @@ class FeedValidator:
 
             # Validate content type
             content_type = response.headers.get("content-type", "").lower()
-            valid_types = [
-                "application/rss+xml",
-                "application/atom+xml",
-                "application/xml",
-                "text/xml",
-            ]
-
-            if not any(valid_type in content_type for valid_type in valid_types):
+            if not FeedValidator._CT_RE.search(content_type):
                 health.warnings.append(f"Unexpected content type: {content_type}")
 
         except requests.exceptions.Timeout:
@@ -105,9 +149,18 @@ class FeedValidator:
             health.errors.append(f"Network error: {str(e)}")
             return health
 
-        # Parse feed content
+        if response.status_code >= 400:
+            health.errors.append(f"HTTP error {response.status_code}")
+            return health
+
+        # requests has already decompressed the body; log what went over the wire
+        logger.debug(
+            "Fetched %s (content-encoding: %s)", url, response.headers.get("content-encoding")
+        )
+
+        # Parse the body we already downloaded instead of fetching the feed again
         try:
-            feed = self.parser.parse_feed(url)
+            feed = self.parser.parse_feed_bytes(response.content, url, response.headers)
             if feed:
                 health.is_valid = True
                 health.entry_count = len(feed.entries)
@@ -125,6 +178,27 @@ class FeedValidator:
 
         return health
 
+    def validate_feeds(self, urls: Iterable[str], max_workers: int = 16) -> Dict[str, FeedHealth]:
+        """
+        Validate several feeds concurrently.
+
+        Requests overlap on a thread pool, so total time tracks the slowest feed
+        rather than the sum of all of them.
+
+        Args:
+            urls: Feed URLs to validate
+            max_workers: Maximum number of feeds fetched at once
+
+        Returns:
+            Mapping of feed URL to its FeedHealth, in input order
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.validate_feed, urls)))
+
     def _check_feed_quality(self, feed, health: FeedHealth):
         """Check feed quality and add warnings for common issues."""
 
@@ -133,27 +207,47 @@ class FeedValidator:
             health.warnings.append("Feed has no entries")
             return
 
+        # Gather entry statistics in a single pass
+        latest_pub = None
+        no_desc_count = 0
+        no_date_count = 0
+        seen_guids = set()
+        has_duplicates = False
+
+        for entry in feed.entries:
+            published = entry.published
+            if published is None:
+                no_date_count += 1
+            elif latest_pub is None or published > latest_pub:
+                latest_pub = published
+
+            if not entry.description and not entry.content:
+                no_desc_count += 1
+
+            guid = entry.guid
+            if guid:
+                if guid in seen_guids:
+                    has_duplicates = True
+                else:
+                    seen_guids.add(guid)
+
         # Check for old content
-        latest_entry = max(feed.entries, key=lambda e: e.published or datetime.min, default=None)
-        if latest_entry and latest_entry.published:
-            days_old = (datetime.utcnow() - latest_entry.published).days
+        if latest_pub is not None:
+            if latest_pub.tzinfo is None:
+                latest_pub = latest_pub.replace(tzinfo=timezone.utc)
+            days_old = (datetime.now(timezone.utc) - latest_pub).days
             if days_old > 90:
                 health.warnings.append(f"Latest entry is {days_old} days old")
 
         # Check entry quality
-        entries_without_description = sum(
-            1 for entry in feed.entries if not entry.description and not entry.content
-        )
-        if entries_without_description > len(feed.entries) * 0.5:
+        if no_desc_count > len(feed.entries) * 0.5:
             health.warnings.append("Many entries lack description/content")
 
-        entries_without_date = sum(1 for entry in feed.entries if not entry.published)
-        if entries_without_date > 0:
-            health.warnings.append(f"{entries_without_date} entries lack publication dates")
+        if no_date_count > 0:
+            health.warnings.append(f"{no_date_count} entries lack publication dates")
 
         # Check for duplicate entries
-        guids = [entry.guid for entry in feed.entries if entry.guid]
-        if len(set(guids)) != len(guids):
+        if has_duplicates:
             health.warnings.append("Feed contains duplicate entries")
 
     def generate_health_report(self, health_results: Dict[str, FeedHealth]) -> str:
@@ -163,8 +257,21 @@ class FeedValidator:
             return "No feeds to report on."
 
         total_feeds = len(health_results)
-        valid_feeds = sum(1 for h in health_results.values() if h.is_valid)
-        reachable_feeds = sum(1 for h in health_results.values() if h.is_reachable)
+        valid_feeds = reachable_feeds = 0
+
+        # Group by status in a single pass
+        healthy_feeds, warning_feeds, broken_feeds = [], [], []
+        for h in health_results.values():
+            if h.is_reachable:
+                reachable_feeds += 1
+            if h.is_valid:
+                valid_feeds += 1
+                if not h.errors:
+                    healthy_feeds.append(h)
+                if h.warnings:
+                    warning_feeds.append(h)
+            if not h.is_valid or h.errors:
+                broken_feeds.append(h)
 
         report = [
             "=== FEED HEALTH REPORT ===",
@@ -174,11 +281,6 @@ class FeedValidator:
             "",
         ]
 
-        # Group by status
-        healthy_feeds = [h for h in health_results.values() if h.is_valid and not h.errors]
-        warning_feeds = [h for h in health_results.values() if h.is_valid and h.warnings]
-        broken_feeds = [h for h in health_results.values() if not h.is_valid or h.errors]
-
         if healthy_feeds:
             report.append("✅ HEALTHY FEEDS:")
             for health in healthy_feeds:
@@ -1,17 +1,21 @@
 """Initialize blog states with current latest posts as already read."""
 
-import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import List
 
 from .web import WebScraper
 from .storage import BlogStorage
-from .core import Post
+from .core import Blog, DetectedPost, Post
 from .detection import SelectorDetector
 from .constants import BLOGS_CONFIG_PATH, LEGACY_BLOGS_PATH
+from .utils import configure_logging, content_hash, read_json
 
+logger = logging.getLogger(__name__)
 
-def load_blogs_from_json(blogs_file: Path = None) -> List[Dict[str, str]]:
+
+def load_blogs_from_json(blogs_file: Path = None) -> List[Blog]:
     """Load blog list from JSON file."""
     if blogs_file is None:
         blogs_file = BLOGS_CONFIG_PATH if BLOGS_CONFIG_PATH.exists() else LEGACY_BLOGS_PATH
@@ -19,104 +23,175 @@ def load_blogs_from_json(blogs_file: Path = None) -> List[Dict[str, str]]:
     if not blogs_file.exists():
         raise FileNotFoundError(f"Blog list file not found: {blogs_file}")
 
-    with open(blogs_file, "r") as f:
-        blogs = json.load(f)
+    return [Blog.from_dict(blog) for blog in read_json(blogs_file)]
+
+
+def _process_one_blog(
+    blog: Blog,
+    storage: BlogStorage,
+    detector: SelectorDetector,
+    scraper: WebScraper,
+    mark_as_read: bool,
+) -> List[str]:
+    """
+    Fetch one blog and record its latest post in storage.
+
+    Returns:
+        Status lines describing what happened, for logging by the caller
+    """
+    blog_name = blog.name
+    blog_url = blog.url
+    messages = []
+
+    try:
+        existing_state = storage.get_blog_state(blog_name)
+
+        # Fetch the page to get latest post info
+        response = scraper.fetch_page(blog_url)
+        if response is None:
+            messages.append("  - Failed to fetch page")
+            storage.increment_failure_count(blog_name, blog_url)
+            return messages
+
+        # Reuse the previous detection if the page body and selectors are unchanged
+        page_hash = (
+            f"{content_hash(response.content)}:{detector.detection_key(blog_url, blog_name)}"
+        )
+        if (
+            existing_state
+            and existing_state.page_hash == page_hash
+            and existing_state.detected_post
+        ):
+            latest_post_info = DetectedPost.from_dict(existing_state.detected_post)
+            messages.append("  - Page unchanged, reusing previous detection")
+        else:
+            soup = scraper.parse_page(response)
+            if not soup:
+                messages.append("  - Failed to fetch page")
+                storage.increment_failure_count(blog_name, blog_url)
+                return messages
+
+            # Use intelligent post detection (with blog name for manual selectors)
+            latest_post_info = detector.get_latest_post(
+                soup,
+                blog_url,
+                blog_name,
+                existing_state.last_post_fingerprint if existing_state else None,
+            )
+            storage.update_blog_state(
+                blog_name,
+                url=blog_url,
+                page_hash=page_hash,
+                detected_post=latest_post_info.to_dict() if latest_post_info else None,
+            )
+
+        if latest_post_info:
+            title = latest_post_info.title
+            url = latest_post_info.url
+            confidence = latest_post_info.confidence
+
+            if mark_as_read:
+                # Create post object for the latest post
+                latest_post = Post(title=title, url=url, blog_name=blog_name)
+                storage.update_latest_post(blog_name, latest_post)
+                messages.append(
+                    f"  - Found latest post: {title[:60]}... (confidence: {confidence:.2f})"
+                )
+            else:
+                storage.update_blog_state(
+                    blog_name, url=blog_url, last_post_title=None, last_post_url=None
+                )
+                messages.append(f"  - Detected post: {title[:60]}... (not marked as read)")
+        else:
+            # Fallback to page title
+            page_title = soup.find("title")
+            if page_title:
+                title_text = page_title.get_text().strip()
+                messages.append(
+                    f"  - Could not detect posts, using page title: {title_text[:60]}..."
+                )
+
+                if mark_as_read:
+                    fallback_post = Post(
+                        title=f"Fallback - {title_text}", url=blog_url, blog_name=blog_name
+                    )
+                    storage.update_latest_post(blog_name, fallback_post)
+                else:
+                    storage.update_blog_state(blog_name, url=blog_url)
+            else:
+                messages.append("  - Could not find any content")
+                storage.update_blog_state(blog_name, url=blog_url)
+
+    except Exception as e:
+        messages.append(f"  - Error: {e}")
+        storage.increment_failure_count(blog_name, blog_url)
+
+    return messages
 
-    return blogs
 
+def _process_blogs(
+    todo: List[Blog], storage: BlogStorage, mark_as_read: bool, max_workers: int
+) -> None:
+    """Fetch and record the blogs that still need a latest post, concurrently."""
+    detector = SelectorDetector()
 
-def initialize_blog_states(blogs_file: Path = None, mark_as_read: bool = True) -> None:
+    # Initialize scraper; storage writes once when the batch closes
+    with (
+        storage.batch(),
+        WebScraper() as scraper,
+        ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor,
+    ):
+        futures = {
+            executor.submit(_process_one_blog, blog, storage, detector, scraper, mark_as_read): blog
+            for blog in todo
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            # One record per blog keeps its status lines together across threads
+            lines = [f"[{i}/{len(todo)}] Processing: {futures[future].name}"]
+            lines.extend(future.result())
+            logger.info("\n".join(lines))
+
+        # Save all states
+        storage.save()
+
+
+def initialize_blog_states(
+    blogs_file: Path = None, mark_as_read: bool = True, max_workers: int = 16
+) -> None:
     """
     Initialize blog states by fetching current latest posts.
 
+    Blogs are fetched concurrently; storage updates are serialized by BlogStorage.
+
     Args:
         blogs_file: Path to JSON file with blog list
         mark_as_read: If True, mark current posts as already read
+        max_workers: Maximum number of blogs fetched at once
     """
-    print("Initializing blog states...")
+    logger.info("Initializing blog states...")
 
     # Load blog list
     blogs = load_blogs_from_json(blogs_file)
-    print(f"Found {len(blogs)} blogs to initialize")
+    logger.info("Found %d blogs to initialize", len(blogs))
 
-    # Initialize storage and detector
+    # Initialize storage
     storage = BlogStorage()
-    detector = SelectorDetector()
-
-    # Initialize scraper
-    with WebScraper() as scraper:
-        for i, blog in enumerate(blogs, 1):
-            blog_name = blog["name"]
-            blog_url = blog["url"]
-
-            print(f"[{i}/{len(blogs)}] Processing: {blog_name}")
-
-            try:
-                # Check if already initialized
-                existing_state = storage.get_blog_state(blog_name)
-                if existing_state and existing_state.last_post_title:
-                    print("  - Already initialized, skipping")
-                    continue
-
-                # Fetch the page to get latest post info
-                soup = scraper.fetch_and_parse(blog_url)
-                if not soup:
-                    print("  - Failed to fetch page")
-                    storage.increment_failure_count(blog_name, blog_url)
-                    continue
-
-                # Use intelligent post detection (with blog name for manual selectors)
-                latest_post_info = detector.get_latest_post(soup, blog_url, blog_name)
-
-                if latest_post_info:
-                    title = latest_post_info["title"]
-                    url = latest_post_info["url"]
-                    confidence = latest_post_info["confidence"]
-
-                    if mark_as_read:
-                        # Create post object for the latest post
-                        latest_post = Post(title=title, url=url, blog_name=blog_name)
-                        storage.update_latest_post(blog_name, latest_post)
-                        print(
-                            f"  - Found latest post: {title[:60]}... (confidence: {confidence:.2f})"
-                        )
-                    else:
-                        storage.update_blog_state(
-                            blog_name, url=blog_url, last_post_title=None, last_post_url=None
-                        )
-                        print(f"  - Detected post: {title[:60]}... (not marked as read)")
-                else:
-                    # Fallback to page title
-                    page_title = soup.find("title")
-                    if page_title:
-                        title_text = page_title.get_text().strip()
-                        print(f"  - Could not detect posts, using page title: {title_text[:60]}...")
-
-                        if mark_as_read:
-                            fallback_post = Post(
-                                title=f"Fallback - {title_text}", url=blog_url, blog_name=blog_name
-                            )
-                            storage.update_latest_post(blog_name, fallback_post)
-                        else:
-                            storage.update_blog_state(blog_name, url=blog_url)
-                    else:
-                        print("  - Could not find any content")
-                        storage.update_blog_state(blog_name, url=blog_url)
-
-            except Exception as e:
-                print(f"  - Error: {e}")
-                storage.increment_failure_count(blog_name, blog_url)
 
-    # Save all states
-    storage.save()
+    # Skip blogs that already have a latest post before any detector or network setup
+    todo = [blog for blog in blogs if not storage.is_initialized(blog.name)]
+    logger.info("%d already initialized, %d to process", len(blogs) - len(todo), len(todo))
+    if todo:
+        _process_blogs(todo, storage, mark_as_read, max_workers)
 
     # Print summary
     summary = storage.get_summary()
-    print("\nInitialization complete!")
-    print(f"- Total blogs: {summary['total_blogs']}")
-    print(f"- Failed blogs: {summary['failed_blogs']}")
-    print(f"- Storage saved to: {summary['storage_path']}")
+    logger.info("\nInitialization complete!")
+    logger.info("- Total blogs: %d", summary["total_blogs"])
+    logger.info("- Failed blogs: %d", summary["failed_blogs"])
+    logger.info("- Storage saved to: %s", summary["storage_path"])
 
 
 if __name__ == "__main__":
+    configure_logging()
     initialize_blog_states(mark_as_read=True)
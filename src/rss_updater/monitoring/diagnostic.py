@@ -1,27 +1,40 @@
 """Diagnostic tools for analyzing blog structure and selector detection."""
 
-import json
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Optional
+
+import soupsieve
 
 from ..web import WebScraper
 from ..detection import SelectorDetector
+from ..utils import read_json
+
+# Container selectors suggested when they match a handful of elements
+_SUGGESTION_SELECTORS = {
+    selector: soupsieve.compile(selector)
+    for selector in ("article", "section", ".post", ".entry", ".blog-post")
+}
 
 
-def analyze_blog_structure(url: str, blog_name: str = None) -> None:
+def analyze_blog_structure(
+    url: str, blog_name: str = None, scraper: Optional[WebScraper] = None
+) -> None:
     """
     Analyze a blog's structure to help with manual selector tuning.
 
     Args:
         url: The blog URL to analyze
         blog_name: Optional blog name for display
+        scraper: Optional scraper to reuse (e.g. across a loop) instead of creating one
     """
     print(f"\n{'=' * 60}")
     print(f"ANALYZING: {blog_name or url}")
     print(f"URL: {url}")
     print(f"{'=' * 60}")
 
-    with WebScraper() as scraper:
-        soup = scraper.fetch_and_parse(url)
+    with nullcontext(scraper) if scraper else WebScraper() as active_scraper:
+        soup = active_scraper.fetch_and_parse(url)
         if not soup:
             print("❌ Failed to fetch page")
             return
@@ -57,9 +70,9 @@ def analyze_blog_structure(url: str, blog_name: str = None) -> None:
         latest_post = detector.get_latest_post(soup, url)
         if latest_post:
             print("✅ Latest post detected:")
-            print(f"   Title: {latest_post['title']}")
-            print(f"   URL: {latest_post['url']}")
-            print(f"   Confidence: {latest_post['confidence']:.2f}")
+            print(f"   Title: {latest_post.title}")
+            print(f"   URL: {latest_post.url}")
+            print(f"   Confidence: {latest_post.confidence:.2f}")
         else:
             print("❌ Could not extract latest post with best selector")
             print("\n🔧 SUGGESTED MANUAL SELECTORS:")
@@ -120,8 +133,8 @@ def _suggest_manual_selectors(soup, url: str) -> None:
                 suggestions.append(f"h{elem.name[1]} a")
 
     # Look for common patterns
-    for selector in ["article", "section", ".post", ".entry", ".blog-post"]:
-        elements = soup.select(selector)
+    for selector, compiled in _SUGGESTION_SELECTORS.items():
+        elements = compiled.select(soup)
         if 1 <= len(elements) <= 10:
             suggestions.append(selector)
 
@@ -143,8 +156,10 @@ def _extract_text_sample(element) -> str:
     if len(text) > 20:
         return text
 
-    # If too short, try child elements
-    for child in element.find_all(["h1", "h2", "h3", "h4", "a"]):
+    # If too short, try child elements, stopping at the first usable one
+    for child in element.descendants:
+        if child.name not in ("h1", "h2", "h3", "h4", "a"):
+            continue
         child_text = child.get_text().strip()
         if len(child_text) > 10:
             return child_text
@@ -161,8 +176,7 @@ def analyze_failed_blogs() -> None:
         print("❌ No blog states found. Run initialization first.")
         return
 
-    with open(states_file, "r") as f:
-        states = json.load(f)
+    states = read_json(states_file)
 
     # Find fallback blogs
     fallback_blogs = []
@@ -182,24 +196,26 @@ def analyze_failed_blogs() -> None:
     print("DETAILED ANALYSIS")
     print(f"{'=' * 60}")
 
-    for blog_name, url in fallback_blogs:
-        analyze_blog_structure(url, blog_name)
-        input("\nPress Enter to continue to next blog...")
+    with WebScraper() as scraper:
+        for blog_name, url in fallback_blogs:
+            analyze_blog_structure(url, blog_name, scraper=scraper)
+            input("\nPress Enter to continue to next blog...")
 
 
-def test_manual_selector(url: str, selector: str) -> None:
+def test_manual_selector(url: str, selector: str, scraper: Optional[WebScraper] = None) -> None:
     """
     Test a manual selector on a blog.
 
     Args:
         url: The blog URL
         selector: The CSS selector to test
+        scraper: Optional scraper to reuse (e.g. across a loop) instead of creating one
     """
     print(f"\n🧪 TESTING SELECTOR: {selector}")
     print(f"URL: {url}")
 
-    with WebScraper() as scraper:
-        soup = scraper.fetch_and_parse(url)
+    with nullcontext(scraper) if scraper else WebScraper() as active_scraper:
+        soup = active_scraper.fetch_and_parse(url)
         if not soup:
             print("❌ Failed to fetch page")
             return
@@ -216,8 +232,8 @@ def test_manual_selector(url: str, selector: str) -> None:
         # Show found elements
         for i, elem in enumerate(elements[:5], 1):
             title = _extract_text_sample(elem)
-            links = elem.find_all("a", href=True)
-            link_text = f" -> {links[0].get('href')}" if links else ""
+            link = elem.find("a", href=True)
+            link_text = f" -> {link.get('href')}" if link else ""
             print(f"   {i}. {title[:60]}...{link_text}")
 
         if len(elements) > 5:
@@ -1,19 +1,45 @@
 """Blog monitoring system for detecting new posts."""
 
-import json
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 
-from ..core import AppConfig, Post
+from bs4 import BeautifulSoup
+
+from ..core import AppConfig, DetectedPost, Post
 from ..detection import SelectorDetector
-from ..web import WebScraper
+from ..web import WebScraper, create_session
 from ..storage import BlogStorage
-from ..utils import clean_text
+from ..utils import content_hash, group_by_host, post_fingerprint, read_json_cached
 
 
 from ..notification.reminder import send_reminder_for_feed_blogs
 
+logger = logging.getLogger(__name__)
+
+# Per-process detector used by detect_latest_post in parse worker processes
+_worker_detector: Optional[SelectorDetector] = None
+
+
+def detect_latest_post(
+    body: bytes, blog_url: str, blog_name: str, last_post_fingerprint: Optional[str] = None
+) -> Optional[DetectedPost]:
+    """
+    Parse a page and detect its latest post.
+
+    Top-level so it can run in a ProcessPoolExecutor; only the bytes and the small
+    DetectedPost cross the process boundary, never the parsed tree.
+    """
+    global _worker_detector
+    if _worker_detector is None:
+        _worker_detector = SelectorDetector()
+
+    soup = BeautifulSoup(body, "lxml")
+    return _worker_detector.get_latest_post(soup, blog_url, blog_name, last_post_fingerprint)
+
 
 class BlogMonitor:
     """Orchestrates checking for changes across all blogs."""
@@ -31,6 +57,10 @@ class BlogMonitor:
             "new_posts_found": 0,
             "errors": [],
         }
+        # Guards new_posts/stats when hosts are checked from worker threads
+        self._lock = threading.Lock()
+        self._checked_count = 0
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
     def check_all_blogs(self) -> Dict:
         """
@@ -39,64 +69,100 @@ class BlogMonitor:
         Returns:
             Dictionary with monitoring results and statistics
         """
-        print("Starting blog monitoring...")
+        logger.info("Starting blog monitoring...")
 
         # Load blogs from JSON file
         blogs = self._load_blogs()
         self.stats["total_blogs"] = len(blogs)
 
-        # Handle feed-based blogs
-        send_reminder_for_feed_blogs(self.config, self.storage, blogs)
-
         # Filter for scrape-based blogs
         scrape_blogs = [b for b in blogs if b.get("monitoring_strategy", "scrape") == "scrape"]
 
-        print(f"Checking {len(scrape_blogs)} blogs for new posts...")
+        logger.info("Checking %d blogs for new posts...", len(scrape_blogs))
+
+        # One worker per host, each with its own rate-limited scraper over a shared
+        # connection pool: a host is never hit in parallel, different hosts overlap.
+        host_groups = group_by_host(scrape_blogs)
+        max_workers = max(1, min(self.config.max_concurrency, len(host_groups)))
+        session = create_session(self.config.user_agent, pool_maxsize=max_workers)
+        # Parsing is CPU-bound, so optionally hand it to worker processes
+        if self.config.parse_processes > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.config.parse_processes)
+        try:
+            # One extra worker handles feed-based blog reminders (SMTP) alongside scraping;
+            # saves made meanwhile (e.g. by the reminder) are written once when the batch ends
+            with (
+                self.storage.batch(),
+                session,
+                ThreadPoolExecutor(max_workers=max_workers + 1) as executor,
+            ):
+                reminder_future = executor.submit(
+                    send_reminder_for_feed_blogs, self.config, self.storage, blogs
+                )
+                futures = [
+                    executor.submit(self._check_host_blogs, session, host_blogs, len(scrape_blogs))
+                    for host_blogs in host_groups.values()
+                ]
+                for future in futures:
+                    future.result()
+                reminder_future.result()
+
+                # Save updated states
+                self.storage.save()
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+
+        # Return results
+        results = {
+            "new_posts": self.new_posts,
+            "stats": self.stats,
+            "failed_blogs": self.storage.get_failed_blogs(self.config.failure_threshold),
+        }
+
+        logger.info("\nMonitoring complete!")
+        logger.info("✅ Checked: %d/%d", self.stats["checked_blogs"], self.stats["total_blogs"])
+        logger.info("🎉 New posts: %d", self.stats["new_posts_found"])
+        logger.info("❌ Failures: %d", self.stats["failed_blogs"])
+
+        return results
 
-        with WebScraper(user_agent=self.config.user_agent) as scraper:
-            for i, blog in enumerate(scrape_blogs, 1):
+    def _check_host_blogs(self, session, blogs: List[Mapping[str, str]], total: int) -> None:
+        """Check blogs that share a host one after another."""
+        with WebScraper(user_agent=self.config.user_agent, session=session) as scraper:
+            for blog in blogs:
                 blog_name = blog["name"]
                 blog_url = blog["url"]
 
-                print(f"[{i}/{len(blogs)}] Checking: {blog_name}")
+                with self._lock:
+                    self._checked_count += 1
+                    position = self._checked_count
+                logger.info("[%d/%d] Checking: %s", position, total, blog_name)
 
                 try:
                     new_post = self.check_blog(scraper, blog_name, blog_url)
+                    with self._lock:
+                        if new_post:
+                            self.new_posts.append(new_post)
+                            self.stats["new_posts_found"] += 1
+                        self.stats["checked_blogs"] += 1
+
                     if new_post:
-                        self.new_posts.append(new_post)
-                        self.stats["new_posts_found"] += 1
-                        print(f"  🎉 NEW POST: {new_post.title[:60]}...")
+                        logger.info("  🎉 NEW POST (%s): %s...", blog_name, new_post.title[:60])
                     else:
-                        print("  ✓ No new posts")
-
-                    self.stats["checked_blogs"] += 1
+                        logger.info("  ✓ No new posts (%s)", blog_name)
 
                 except Exception as e:
                     error_msg = f"Error checking {blog_name}: {e}"
-                    print(f"  ❌ {error_msg}")
-                    self.stats["errors"].append(error_msg)
-                    self.stats["failed_blogs"] += 1
+                    logger.warning("  ❌ %s", error_msg)
+                    with self._lock:
+                        self.stats["errors"].append(error_msg)
+                        self.stats["failed_blogs"] += 1
 
                     # Increment failure count
                     self.storage.increment_failure_count(blog_name, blog_url)
 
-        # Save updated states
-        self.storage.save()
-
-        # Return results
-        results = {
-            "new_posts": self.new_posts,
-            "stats": self.stats,
-            "failed_blogs": self.storage.get_failed_blogs(self.config.failure_threshold),
-        }
-
-        print("\nMonitoring complete!")
-        print(f"✅ Checked: {self.stats['checked_blogs']}/{self.stats['total_blogs']}")
-        print(f"🎉 New posts: {self.stats['new_posts_found']}")
-        print(f"❌ Failures: {self.stats['failed_blogs']}")
-
-        return results
-
     def mark_posts_as_notified(self, new_posts: List[Post]) -> None:
         """
         Mark new posts as successfully notified by updating storage.
@@ -127,25 +193,70 @@ class BlogMonitor:
         # Get current state
         current_state = self.storage.get_blog_state(blog_name)
 
-        # Fetch and parse the page
-        soup = scraper.fetch_and_parse(blog_url)
-        if not soup:
+        # Fetch the page, conditionally if an earlier check saw it unchanged
+        response = scraper.fetch_page(
+            blog_url,
+            etag=current_state.page_etag if current_state else None,
+            last_modified=current_state.page_last_modified if current_state else None,
+        )
+        if response is None:
             raise Exception("Failed to fetch page")
 
-        # Get latest post using intelligent detection
-        latest_post_info = self.detector.get_latest_post(soup, blog_url, blog_name)
+        if response.status_code == 304:
+            # Page unchanged since a check that found no new post
+            self.storage.reset_failure_count(blog_name)
+            return None
 
-        if not latest_post_info:
-            raise Exception("Could not detect any posts")
+        # A byte-identical page read with the same selectors yields the same detection,
+        # so skip parsing it again
+        page_hash = (
+            f"{content_hash(response.content)}:"
+            f"{self.detector.detection_key(blog_url, blog_name)}"
+        )
+        if current_state and current_state.page_hash == page_hash and current_state.detected_post:
+            latest_post_info = DetectedPost.from_dict(current_state.detected_post)
+        else:
+            # Get latest post using intelligent detection
+            fingerprint = current_state.last_post_fingerprint if current_state else None
+            if self._parse_pool is not None:
+                latest_post_info = self._parse_pool.submit(
+                    detect_latest_post, response.content, blog_url, blog_name, fingerprint
+                ).result()
+            else:
+                soup = scraper.parse_page(response)
+                if not soup:
+                    raise Exception("Failed to fetch page")
+                latest_post_info = self.detector.get_latest_post(
+                    soup, blog_url, blog_name, fingerprint
+                )
+
+            # Replace the stored detection, dropping it if this page and selectors found none
+            self.storage.update_blog_state(
+                blog_name,
+                page_hash=page_hash,
+                detected_post=latest_post_info.to_dict() if latest_post_info else None,
+            )
+
+            if not latest_post_info:
+                raise Exception("Could not detect any posts")
 
         # Create Post object
         latest_post = Post(
-            title=latest_post_info["title"], url=latest_post_info["url"], blog_name=blog_name
+            title=latest_post_info.title, url=latest_post_info.url, blog_name=blog_name
         )
 
         # Check if this is a new post
         is_new_post = self._is_new_post(latest_post, current_state)
 
+        # Only trust a 304 next time if this page had nothing new; a new post stays
+        # unconfirmed until it is notified, so it must be re-detected on the next run.
+        if is_new_post:
+            self.storage.update_page_validators(blog_name, None, None)
+        else:
+            self.storage.update_page_validators(
+                blog_name, response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+
         # Only reset failure count on successful check (don't update latest post yet)
         self.storage.reset_failure_count(blog_name)
 
@@ -178,24 +289,23 @@ class BlogMonitor:
         if stored_title and stored_title.startswith("Fallback -"):
             return True
 
-        # Compare title and URL
-        title_different = clean_text(latest_post.title) != clean_text(stored_title or "")
-        url_different = latest_post.url != stored_url
+        # A permalink recorded earlier is an old post resurfacing (e.g. a pinned post)
+        if current_state.has_seen_url(latest_post.url):
+            return False
 
-        # Consider new if either title or URL is different
-        return title_different or url_different
+        # Compare title and URL: new if either differs
+        return post_fingerprint(latest_post.title, latest_post.url) != (
+            current_state.last_post_fingerprint
+        )
 
-    def _load_blogs(self) -> List[Dict[str, str]]:
-        """Load blog list from JSON file."""
+    def _load_blogs(self) -> Sequence[Mapping[str, str]]:
+        """Load blog list from JSON file (read-only: shared through read_json_cached)."""
         blogs_file = Path("config/app/blogs.json")
 
         if not blogs_file.exists():
             raise FileNotFoundError(f"Blog list file not found: {blogs_file}")
 
-        with open(blogs_file, "r") as f:
-            blogs = json.load(f)
-
-        return blogs
+        return read_json_cached(blogs_file)
 
     def get_summary(self) -> str:
         """Get a text summary of the monitoring results."""
@@ -234,10 +344,11 @@ class BlogMonitor:
         summary.append(f"\n⚠️  Persistently Failed Blogs ({len(failed_blogs)}):")
         summary.append("=" * 40)
 
+        now = datetime.now()
         for blog_name, state in failed_blogs.items():
             days_failed = "Unknown"
             if state.last_success:
-                days_failed = (datetime.now() - state.last_success).days
+                days_failed = (now - state.last_success).days
 
             summary.append(f"• {blog_name}")
             summary.append(f"  Failures: {state.failure_count}")
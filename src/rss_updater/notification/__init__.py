@@ -3,5 +3,6 @@
 from .emailer import EmailNotifier
 from .content_generator import ContentGenerator
 from .email_sender import EmailSender
+from .reminder import send_reminder_for_feed_blogs
 
-__all__ = ["EmailNotifier", "ContentGenerator", "EmailSender"]
+__all__ = ["EmailNotifier", "ContentGenerator", "EmailSender", "send_reminder_for_feed_blogs"]
@@ -1,32 +1,15 @@
 """Email content generation for RSS notifications."""
 
+import html
 from datetime import datetime
-from typing import List
+from operator import attrgetter
+from typing import List, Optional, Tuple
 from ..core import Post
 
+_BY_BLOG = attrgetter("blog_name")
 
-class ContentGenerator:
-    """Generates email content for RSS notifications."""
-
-    def create_subject(self, new_posts: List[Post], stats: dict) -> str:
-        """Create email subject line."""
-        count = len(new_posts)
-        date = datetime.now().strftime("%Y-%m-%d")
-
-        if count == 0:
-            return f"RSS Digest {date} - No new posts"
-        elif count == 1:
-            return f"RSS Digest {date} - 1 new post"
-        else:
-            return f"RSS Digest {date} - {count} new posts"
-
-    def create_html_content(
-        self, new_posts: List[Post], stats: dict, failed_blogs_summary: str
-    ) -> str:
-        """Create HTML email content."""
-        date = datetime.now().strftime("%B %d, %Y")
-
-        html = f"""
+# Parts of the digest HTML, built once at import instead of per call
+_DIGEST_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -34,134 +17,110 @@ class ContentGenerator:
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>RSS Digest</title>
             <style>
-                body {{
+                body {
                     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
                     line-height: 1.6;
                     max-width: 600px;
                     margin: 0 auto;
                     padding: 20px;
                     color: #333;
-                }}
-                .header {{
+                }
+                .header {
                     border-bottom: 2px solid #007acc;
                     padding-bottom: 20px;
                     margin-bottom: 30px;
-                }}
-                .header h1 {{
+                }
+                .header h1 {
                     color: #007acc;
                     margin: 0;
                     font-size: 28px;
-                }}
-                .date {{
+                }
+                .date {
                     color: #666;
                     font-size: 16px;
                     margin-top: 5px;
-                }}
-                .summary {{
+                }
+                .summary {
                     background: #f8f9fa;
                     padding: 15px;
                     border-radius: 5px;
                     margin-bottom: 30px;
-                }}
-                .post {{
+                }
+                .post {
                     margin-bottom: 25px;
                     padding-bottom: 20px;
                     border-bottom: 1px solid #eee;
-                }}
-                .post:last-child {{
+                }
+                .post:last-child {
                     border-bottom: none;
-                }}
-                .post-title {{
+                }
+                .post-title {
                     font-size: 18px;
                     font-weight: 600;
                     margin-bottom: 8px;
-                }}
-                .post-title a {{
+                }
+                .post-title a {
                     color: #007acc;
                     text-decoration: none;
-                }}
-                .post-title a:hover {{
+                }
+                .post-title a:hover {
                     text-decoration: underline;
-                }}
-                .blog-name {{
+                }
+                .blog-name {
                     color: #666;
                     font-size: 14px;
                     margin-bottom: 5px;
-                }}
-                .post-url {{
+                }
+                .post-url {
                     font-size: 12px;
                     color: #888;
                     word-break: break-all;
-                }}
-                .no-posts {{
+                }
+                .no-posts {
                     text-align: center;
                     color: #666;
                     font-style: italic;
                     padding: 40px 20px;
-                }}
-                .failed-blogs {{
+                }
+                .failed-blogs {
                     background: #fff3cd;
                     border: 1px solid #ffeaa7;
                     padding: 15px;
                     border-radius: 5px;
                     margin-top: 30px;
-                }}
-                .failed-blogs h3 {{
+                }
+                .failed-blogs h3 {
                     color: #856404;
                     margin-top: 0;
-                }}
-                .footer {{
+                }
+                .footer {
                     margin-top: 40px;
                     padding-top: 20px;
                     border-top: 1px solid #eee;
                     text-align: center;
                     color: #666;
                     font-size: 12px;
-                }}
+                }
             </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📰 RSS Digest</h1>
-                <div class="date">{date}</div>
-            </div>
-
-            <div class="summary">
-                <strong>Summary:</strong> {len(new_posts)} new posts from {stats.get("checked_blogs", 0)} blogs
-            </div>
-        """
+        </head>"""
 
-        if new_posts:
-            # Sort posts chronologically (newest first)
-            sorted_posts = sorted(new_posts, key=lambda p: p.blog_name)
-
-            for post in sorted_posts:
-                html += f"""
+_POST_HTML = """
                 <div class="post">
-                    <div class="blog-name">📖 {post.blog_name}</div>
+                    <div class="blog-name">📖 {blog_name}</div>
                     <div class="post-title">
-                        <a href="{post.url}">{post.title}</a>
+                        <a href="{url}">{title}</a>
                     </div>
-                    <div class="post-url">{post.url}</div>
+                    <div class="post-url">{url}</div>
                 </div>
                 """
-        else:
-            html += """
+
+_NO_POSTS_HTML = """
             <div class="no-posts">
                 No new posts today. All caught up! 🎉
             </div>
             """
 
-        # Add failed blogs warning if any
-        if failed_blogs_summary:
-            html += f"""
-            <div class="failed-blogs">
-                <h3>⚠️ Blog Monitoring Issues</h3>
-                <pre style="white-space: pre-wrap; font-family: inherit;">{failed_blogs_summary}</pre>
-            </div>
-            """
-
-        html += """
+_FOOTER_HTML = """
             <div class="footer">
                 Generated by Personal RSS Updater<br>
                 🤖 Powered by intelligent web scraping
@@ -170,29 +129,126 @@ class ContentGenerator:
         </html>
         """
 
-        return html
+
+class ContentGenerator:
+    """Generates email content for RSS notifications."""
+
+    def create_subject(
+        self, new_posts: List[Post], stats: dict, now: Optional[datetime] = None
+    ) -> str:
+        """Create email subject line."""
+        count = len(new_posts)
+        date = (now or datetime.now()).strftime("%Y-%m-%d")
+
+        if count == 0:
+            return f"RSS Digest {date} - No new posts"
+        elif count == 1:
+            return f"RSS Digest {date} - 1 new post"
+        else:
+            return f"RSS Digest {date} - {count} new posts"
+
+    def create_html_and_text(
+        self,
+        new_posts: List[Post],
+        stats: dict,
+        failed_blogs_summary: str,
+        now: Optional[datetime] = None,
+    ) -> Tuple[str, str]:
+        """Create the HTML and plain text bodies of a digest, sorting the posts once."""
+        now = now or datetime.now()
+        sorted_posts = sorted(new_posts, key=_BY_BLOG)
+        return (
+            self._build_html(sorted_posts, stats, failed_blogs_summary, now),
+            self._build_text(sorted_posts, stats, failed_blogs_summary, now),
+        )
+
+    def create_html_content(
+        self,
+        new_posts: List[Post],
+        stats: dict,
+        failed_blogs_summary: str,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """Create HTML email content."""
+        sorted_posts = sorted(new_posts, key=_BY_BLOG)
+        return self._build_html(sorted_posts, stats, failed_blogs_summary, now or datetime.now())
 
     def create_text_content(
-        self, new_posts: List[Post], stats: dict, failed_blogs_summary: str
+        self,
+        new_posts: List[Post],
+        stats: dict,
+        failed_blogs_summary: str,
+        now: Optional[datetime] = None,
     ) -> str:
         """Create plain text email content."""
-        date = datetime.now().strftime("%B %d, %Y")
+        sorted_posts = sorted(new_posts, key=_BY_BLOG)
+        return self._build_text(sorted_posts, stats, failed_blogs_summary, now or datetime.now())
+
+    def _build_html(
+        self, sorted_posts: List[Post], stats: dict, failed_blogs_summary: str, now: datetime
+    ) -> str:
+        """Build the HTML body from posts already sorted by blog name."""
+        date = now.strftime("%B %d, %Y")
+
+        # Collect fragments and join once instead of growing one string per post
+        parts = []
+        parts.append(_DIGEST_HEAD)
+        parts.append(f"""
+        <body>
+            <div class="header">
+                <h1>📰 RSS Digest</h1>
+                <div class="date">{date}</div>
+            </div>
+
+            <div class="summary">
+                <strong>Summary:</strong> {len(sorted_posts)} new posts from {stats.get("checked_blogs", 0)} blogs
+            </div>
+        """)
+
+        if sorted_posts:
+            for post in sorted_posts:
+                parts.append(
+                    _POST_HTML.format(
+                        blog_name=html.escape(post.blog_name),
+                        title=html.escape(post.title),
+                        url=html.escape(post.url),
+                    )
+                )
+        else:
+            parts.append(_NO_POSTS_HTML)
+
+        # Add failed blogs warning if any
+        if failed_blogs_summary:
+            summary = html.escape(failed_blogs_summary)
+            parts.append(f"""
+            <div class="failed-blogs">
+                <h3>⚠️ Blog Monitoring Issues</h3>
+                <pre style="white-space: pre-wrap; font-family: inherit;">{summary}</pre>
+            </div>
+            """)
+
+        parts.append(_FOOTER_HTML)
+
+        return "".join(parts)
+
+    def _build_text(
+        self, sorted_posts: List[Post], stats: dict, failed_blogs_summary: str, now: datetime
+    ) -> str:
+        """Build the plain text body from posts already sorted by blog name."""
+        date = now.strftime("%B %d, %Y")
 
         lines = []
         lines.append(f"RSS DIGEST - {date}")
         lines.append("=" * 40)
         lines.append(
-            f"Summary: {len(new_posts)} new posts from {stats.get('checked_blogs', 0)} blogs"
+            f"Summary: {len(sorted_posts)} new posts from {stats.get('checked_blogs', 0)} blogs"
         )
         lines.append("")
 
-        if new_posts:
+        if sorted_posts:
             lines.append("NEW POSTS:")
             lines.append("-" * 20)
 
-            # Sort posts by blog name
-            sorted_posts = sorted(new_posts, key=lambda p: p.blog_name)
-
             for post in sorted_posts:
                 lines.append(f"📖 {post.blog_name}")
                 lines.append(f"   {post.title}")
@@ -1,8 +1,7 @@
 """Email sending functionality with retry logic."""
 
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 from time import sleep
 from ..core import AppConfig
 
@@ -13,6 +12,23 @@ class EmailSender:
     def __init__(self, config: AppConfig):
         """Initialize email sender with configuration."""
         self.config = config
+        # Envelope headers are the same for every message this sender builds
+        self._from = config.email.username
+        self._to = config.email.recipient
+
+    def _deliver(self, msg: EmailMessage) -> None:
+        """Connect, log in and send one message, always closing the connection."""
+        server = smtplib.SMTP(self.config.email.smtp_server, self.config.email.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.config.email.username, self.config.email.password)
+            server.send_message(msg)
+        finally:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                # The message is already sent (or the error above is the one to report)
+                server.close()
 
     def send_email(self, subject: str, html_content: str, text_content: str) -> bool:
         """
@@ -28,28 +44,20 @@ class EmailSender:
         """
         max_retries = 3
 
-        for attempt in range(max_retries):
-            try:
-                # Create message
-                msg = MIMEMultipart("alternative")
-                msg["Subject"] = subject
-                msg["From"] = self.config.email.username
-                msg["To"] = self.config.email.recipient
-
-                # Attach text and HTML parts
-                text_part = MIMEText(text_content, "plain", "utf-8")
-                html_part = MIMEText(html_content, "html", "utf-8")
+        # Create message once; retries resend the same one
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = self._from
+        msg["To"] = self._to
 
-                msg.attach(text_part)
-                msg.attach(html_part)
+        # Plain text body with an HTML alternative (multipart/alternative)
+        msg.set_content(text_content)
+        msg.add_alternative(html_content, subtype="html")
 
+        for attempt in range(max_retries):
+            try:
                 # Send email
-                with smtplib.SMTP(
-                    self.config.email.smtp_server, self.config.email.smtp_port
-                ) as server:
-                    server.starttls()
-                    server.login(self.config.email.username, self.config.email.password)
-                    server.send_message(msg)
+                self._deliver(msg)
 
                 return True
 
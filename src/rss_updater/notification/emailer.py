@@ -1,11 +1,18 @@
 """Main email notifier class."""
 
+import html
+from datetime import datetime
 from typing import List
 from ..core import AppConfig, Post
 from .content_generator import ContentGenerator
 from .reminder_generator import ReminderGenerator
 from .email_sender import EmailSender
 
+# Escapes like html.escape and turns newlines into <br>, in one pass
+_CONTENT_TO_HTML = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;", "\n": "<br>"}
+)
+
 
 class EmailNotifier:
     """Handles email notifications for new blog posts."""
@@ -36,13 +43,11 @@ class EmailNotifier:
             return True
 
         try:
-            # Create email message
-            subject = self.content_generator.create_subject(new_posts, stats)
-            html_content = self.content_generator.create_html_content(
-                new_posts, stats, failed_blogs_summary
-            )
-            text_content = self.content_generator.create_text_content(
-                new_posts, stats, failed_blogs_summary
+            # Create email message, dating every part from the same moment
+            now = datetime.now()
+            subject = self.content_generator.create_subject(new_posts, stats, now)
+            html_content, text_content = self.content_generator.create_html_and_text(
+                new_posts, stats, failed_blogs_summary, now
             )
 
             # Send email
@@ -121,14 +126,18 @@ class EmailNotifier:
             # Handle posts with content (like consolidated reminders)
             if hasattr(post, "content") and post.content:
                 # Convert newlines to <br> for HTML and add proper formatting
-                html_content_body = post.content.replace("\n", "<br>")
+                html_content_body = post.content.translate(_CONTENT_TO_HTML)
                 html_content = (
-                    f'<h1>{post.title}</h1><div style="margin: 20px 0;">{html_content_body}</div>'
+                    f"<h1>{html.escape(post.title)}</h1>"
+                    f'<div style="margin: 20px 0;">{html_content_body}</div>'
                 )
                 text_content = f"{post.title}\n\n{post.content}"
             else:
                 # Standard single post format
-                html_content = f'<h1>{post.title}</h1><p><a href="{post.url}">Read more</a></p>'
+                html_content = (
+                    f"<h1>{html.escape(post.title)}</h1>"
+                    f'<p><a href="{html.escape(post.url)}">Read more</a></p>'
+                )
                 text_content = f"{post.title}\n{post.url}"
 
             success = self.email_sender.send_email(subject, html_content, text_content)
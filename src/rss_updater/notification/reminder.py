@@ -1,19 +1,23 @@
 """Handles sending reminders for feed-based blogs."""
 
+import logging
 from datetime import datetime, timedelta
-from typing import List
+from typing import Mapping, Sequence
 
 from ..core import AppConfig, Post
 from ..storage import BlogStorage
 from . import EmailNotifier
 
+logger = logging.getLogger(__name__)
 
-def send_reminder_for_feed_blogs(config: AppConfig, storage: BlogStorage, blogs: List[dict]):
+
+def send_reminder_for_feed_blogs(config: AppConfig, storage: BlogStorage, blogs: Sequence[Mapping]):
     """Sends consolidated reminder for blogs with the 'feed' monitoring strategy."""
-    print("Checking for feed-based blogs that need reminders...")
+    logger.info("Checking for feed-based blogs that need reminders...")
 
     # Find all feed blogs that need reminders
     feed_blogs_needing_reminders = []
+    reminder_due = datetime.now() - timedelta(weeks=2)
 
     for blog in blogs:
         if blog.get("monitoring_strategy") == "feed":
@@ -24,7 +28,7 @@ def send_reminder_for_feed_blogs(config: AppConfig, storage: BlogStorage, blogs:
             needs_reminder = (
                 not blog_state
                 or not blog_state.last_reminder_sent
-                or (datetime.now() - blog_state.last_reminder_sent) > timedelta(weeks=2)
+                or blog_state.last_reminder_sent < reminder_due
             )
 
             if needs_reminder:
@@ -32,8 +36,9 @@ def send_reminder_for_feed_blogs(config: AppConfig, storage: BlogStorage, blogs:
 
     # If we have blogs needing reminders, send one consolidated email
     if feed_blogs_needing_reminders:
-        print(
-            f"  -> Sending consolidated reminder for {len(feed_blogs_needing_reminders)} feed blogs"
+        logger.info(
+            "  -> Sending consolidated reminder for %d feed blogs",
+            len(feed_blogs_needing_reminders),
         )
 
         # Create a single consolidated reminder post
@@ -51,14 +56,14 @@ def send_reminder_for_feed_blogs(config: AppConfig, storage: BlogStorage, blogs:
         success = notifier.send_single_post(post)
 
         if success:
-            # Mark all blogs as having received a reminder
-            for blog in feed_blogs_needing_reminders:
-                storage.update_last_reminder_sent(blog["name"])
-
-            # Save the storage updates
-            storage.save()
-            print(f"  ✅ Reminder sent for {len(feed_blogs_needing_reminders)} blogs")
+            # Mark all blogs as having received a reminder, then write the storage once
+            sent_at = datetime.now()
+            with storage.batch():
+                for blog in feed_blogs_needing_reminders:
+                    storage.update_last_reminder_sent(blog["name"], sent_at)
+                storage.save()
+            logger.info("  ✅ Reminder sent for %d blogs", len(feed_blogs_needing_reminders))
         else:
-            print("  ❌ Failed to send consolidated reminder")
+            logger.warning("  ❌ Failed to send consolidated reminder")
     else:
-        print("  ✓ No feed blogs need reminders at this time")
+        logger.info("  ✓ No feed blogs need reminders at this time")
@@ -1,11 +1,35 @@
 """Blog state data structure."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Optional
+from typing import ClassVar, Dict, List, Optional
 
+from ..utils import post_fingerprint, url_hash
 
-@dataclass
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # Optional speedup; fromisoformat reads everything to_dict writes
+    parse_datetime = datetime.fromisoformat
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a stored ISO-8601 timestamp, returning None when missing or invalid.
+
+    Cached because a state file repeats timestamps: a successful check records
+    the same moment as both last_check and last_success.
+    """
+    if not value:
+        return None
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class BlogState:
     """Tracks the state of a single blog."""
 
@@ -13,6 +37,7 @@ class BlogState:
     url: str
     last_post_title: Optional[str] = None
     last_post_url: Optional[str] = None
+    last_post_guid: Optional[str] = None  # Feed GUID of the last post, when known
     last_check: Optional[datetime] = None
     failure_count: int = 0
     last_success: Optional[datetime] = None
@@ -25,13 +50,70 @@ class BlogState:
     feed_modified: Optional[datetime] = None
     last_post_date: Optional[datetime] = None  # Publication date of last post
 
+    # Fingerprint of (cleaned last_post_title, last_post_url) for cheap post comparisons.
+    # Derived on load rather than stored, so it always follows the current title and URL
+    last_post_fingerprint: Optional[str] = field(default=None, init=False, compare=False)
+
+    # Hash of the blog page body plus the detector's detection_key, and the post detected
+    # on it, reused while neither the page nor the selectors change
+    page_hash: Optional[str] = None
+    detected_post: Optional[Dict] = None
+
+    # HTTP validators of the blog page from the last check that found no new post
+    page_etag: Optional[str] = None
+    page_last_modified: Optional[str] = None
+
+    # url_hash() of recently recorded post URLs, oldest first
+    seen_url_hashes: List[str] = field(default_factory=list)
+    MAX_SEEN_URLS: ClassVar[int] = 100
+
+    # Result of the last to_dict(), dropped whenever a field is assigned
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
+    def __post_init__(self):
+        self.refresh_fingerprint()
+
+    def refresh_fingerprint(self) -> None:
+        """Recompute last_post_fingerprint from the stored title and URL."""
+        if self.last_post_title or self.last_post_url:
+            self.last_post_fingerprint = post_fingerprint(self.last_post_title, self.last_post_url)
+        else:
+            self.last_post_fingerprint = None
+
+    def has_seen_url(self, url: Optional[str]) -> bool:
+        """Check whether url was recorded as a latest post before."""
+        return bool(url) and url_hash(url) in self.seen_url_hashes
+
+    def with_seen_url(self, url: Optional[str]) -> List[str]:
+        """
+        Return seen_url_hashes with url appended as the most recent entry.
+
+        The blog's own URL (used for posts without a permalink) is not recorded,
+        and the oldest entries are dropped beyond MAX_SEEN_URLS.
+        """
+        if not url or url_hash(url) == url_hash(self.url or ""):
+            return self.seen_url_hashes
+        new_hash = url_hash(url)
+        seen = [h for h in self.seen_url_hashes if h != new_hash]
+        seen.append(new_hash)
+        return seen[-self.MAX_SEEN_URLS :]
+
     def to_dict(self) -> Dict:
         """Convert blog state to dictionary for JSON serialization."""
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
             "blog_name": self.blog_name,
             "url": self.url,
             "last_post_title": self.last_post_title,
             "last_post_url": self.last_post_url,
+            "last_post_guid": self.last_post_guid,
             "last_check": self.last_check.isoformat() if self.last_check else None,
             "failure_count": self.failure_count,
             "last_success": self.last_success.isoformat() if self.last_success else None,
@@ -43,58 +125,36 @@ class BlogState:
             "feed_etag": self.feed_etag,
             "feed_modified": self.feed_modified.isoformat() if self.feed_modified else None,
             "last_post_date": self.last_post_date.isoformat() if self.last_post_date else None,
+            "page_hash": self.page_hash,
+            "detected_post": self.detected_post,
+            "page_etag": self.page_etag,
+            "page_last_modified": self.page_last_modified,
+            "seen_url_hashes": self.seen_url_hashes,
         }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict) -> "BlogState":
         """Create blog state from dictionary (JSON deserialization)."""
-        last_check = None
-        if data.get("last_check"):
-            try:
-                last_check = datetime.fromisoformat(data["last_check"])
-            except ValueError:
-                pass
-
-        last_success = None
-        if data.get("last_success"):
-            try:
-                last_success = datetime.fromisoformat(data["last_success"])
-            except ValueError:
-                pass
-
-        last_reminder_sent = None
-        if data.get("last_reminder_sent"):
-            try:
-                last_reminder_sent = datetime.fromisoformat(data["last_reminder_sent"])
-            except ValueError:
-                pass
-
-        feed_modified = None
-        if data.get("feed_modified"):
-            try:
-                feed_modified = datetime.fromisoformat(data["feed_modified"])
-            except ValueError:
-                pass
-
-        last_post_date = None
-        if data.get("last_post_date"):
-            try:
-                last_post_date = datetime.fromisoformat(data["last_post_date"])
-            except ValueError:
-                pass
-
+        get = data.get  # Bound once; called for every field of every blog on load
         return cls(
             blog_name=data["blog_name"],
             url=data["url"],
-            last_post_title=data.get("last_post_title"),
-            last_post_url=data.get("last_post_url"),
-            last_check=last_check,
-            failure_count=data.get("failure_count", 0),
-            last_success=last_success,
-            last_reminder_sent=last_reminder_sent,
-            is_problematic=data.get("is_problematic", False),
-            feed_url=data.get("feed_url"),
-            feed_etag=data.get("feed_etag"),
-            feed_modified=feed_modified,
-            last_post_date=last_post_date,
+            last_post_title=get("last_post_title"),
+            last_post_url=get("last_post_url"),
+            last_post_guid=get("last_post_guid"),
+            last_check=_parse_iso(get("last_check")),
+            failure_count=get("failure_count", 0),
+            last_success=_parse_iso(get("last_success")),
+            last_reminder_sent=_parse_iso(get("last_reminder_sent")),
+            is_problematic=get("is_problematic", False),
+            feed_url=get("feed_url"),
+            feed_etag=get("feed_etag"),
+            feed_modified=_parse_iso(get("feed_modified")),
+            last_post_date=_parse_iso(get("last_post_date")),
+            page_hash=get("page_hash"),
+            detected_post=get("detected_post"),
+            page_etag=get("page_etag"),
+            page_last_modified=get("page_last_modified"),
+            seen_url_hashes=get("seen_url_hashes") or [],
         )
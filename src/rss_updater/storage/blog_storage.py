@@ -1,13 +1,20 @@
 """Main blog storage class."""
 
+import threading
+from contextlib import contextmanager
+from dataclasses import fields
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
-from .blog_state import BlogState
+from .blog_state import BlogState, _parse_iso
 from .file_manager import FileManager
 from .sync_manager import SyncManager
 from ..core import Post
+from ..utils import url_hash
+
+# Keyword arguments update_blog_state can pass to a new BlogState
+_STATE_FIELDS = frozenset(f.name for f in fields(BlogState) if f.init) - {"blog_name"}
 
 
 class BlogStorage:
@@ -19,11 +26,20 @@ class BlogStorage:
         self.file_manager = FileManager(self.storage_path)
         self.sync_manager = SyncManager()
         self.blog_states: Dict[str, BlogState] = {}
+        # Guards state updates and saves when blogs are checked from worker threads
+        self._lock = threading.RLock()
+        # Inside batch(), save() only records that a write is pending
+        self._suppress_save = False
+        self._save_pending = False
+        # Last data read from or written to disk; unchanged data is not rewritten
+        self._persisted: Optional[Dict] = {}
         self._load()
 
     def _load(self) -> None:
         """Load blog states from JSON file."""
         data = self.file_manager.load_data()
+        # After a backup recovery nothing is persisted yet, so the next save rewrites the file
+        self._persisted = None if self.file_manager.recovered else data
 
         self.blog_states = {}
         for blog_name, state_data in data.items():
@@ -32,67 +48,126 @@ class BlogStorage:
             except Exception as e:
                 print(f"Warning: Failed to load state for blog '{blog_name}': {e}")
 
+        # Timestamps are only shared within one file, so drop them once it is loaded
+        _parse_iso.cache_clear()
+
     def save(self) -> None:
         """Save blog states to JSON file with automatic backup."""
-        # Convert blog states to dictionary format
-        data = {}
-        for blog_name, state in self.blog_states.items():
-            data[blog_name] = state.to_dict()
+        with self._lock:
+            if self._suppress_save:
+                self._save_pending = True
+                return
+
+            # Convert blog states to dictionary format
+            data = {}
+            for blog_name, state in self.blog_states.items():
+                data[blog_name] = state.to_dict()
+
+            if data == self._persisted:
+                return
 
+            try:
+                self.file_manager.save_data(data)
+                self._persisted = data
+            except Exception as e:
+                print(f"Error saving storage file: {e}")
+                raise
+
+    @contextmanager
+    def batch(self) -> Iterator["BlogStorage"]:
+        """
+        Defer saves made inside the block to a single write on exit.
+
+        Example:
+            with storage.batch():
+                for blog in blogs:
+                    ...  # per-blog updates and save() calls
+        """
+        with self._lock:
+            # Nested batches leave the flush to the outermost one
+            outermost = not self._suppress_save
+            self._suppress_save = True
         try:
-            self.file_manager.save_data(data)
-        except Exception as e:
-            print(f"Error saving storage file: {e}")
-            raise
+            yield self
+        finally:
+            if outermost:
+                with self._lock:
+                    self._suppress_save = False
+                    pending, self._save_pending = self._save_pending, False
+                    if pending:
+                        self.save()
 
     def get_blog_state(self, blog_name: str) -> Optional[BlogState]:
         """Get the state for a specific blog."""
         return self.blog_states.get(blog_name)
 
+    def is_initialized(self, blog_name: str) -> bool:
+        """Check whether a blog already has a recorded latest post."""
+        state = self.blog_states.get(blog_name)
+        return bool(state and state.last_post_title)
+
     def update_blog_state(self, blog_name: str, **kwargs) -> None:
         """Update or create blog state with given parameters."""
-        current_state = self.blog_states.get(blog_name)
-
-        if current_state:
-            # Update existing state
-            for key, value in kwargs.items():
-                if hasattr(current_state, key):
-                    setattr(current_state, key, value)
-        else:
-            # Create new state
-            state_data = {
-                "blog_name": blog_name,
-                "url": kwargs.get("url", ""),
-                "last_post_title": kwargs.get("last_post_title"),
-                "last_post_url": kwargs.get("last_post_url"),
-                "last_check": kwargs.get("last_check"),
-                "failure_count": kwargs.get("failure_count", 0),
-                "last_success": kwargs.get("last_success"),
-            }
-            self.blog_states[blog_name] = BlogState(**state_data)
+        with self._lock:
+            current_state = self.blog_states.get(blog_name)
+
+            if current_state:
+                # Update existing state
+                for key, value in kwargs.items():
+                    if hasattr(current_state, key):
+                        setattr(current_state, key, value)
+
+                if "last_post_title" in kwargs or "last_post_url" in kwargs:
+                    current_state.refresh_fingerprint()
+            else:
+                # Create new state from every known field passed (unknown keys are ignored)
+                state_data = {key: value for key, value in kwargs.items() if key in _STATE_FIELDS}
+                state_data.setdefault("url", "")
+                self.blog_states[blog_name] = BlogState(blog_name=blog_name, **state_data)
 
     def update_latest_post(self, blog_name: str, post: Post) -> None:
         """Update the latest post for a blog."""
-        self.update_blog_state(
-            blog_name,
-            last_post_title=post.title,
-            last_post_url=post.url,
-            last_check=datetime.now(),
-            last_success=datetime.now(),
-        )
-
-    def update_last_reminder_sent(self, blog_name: str) -> None:
-        """Update the last reminder sent timestamp for a blog."""
-        self.update_blog_state(blog_name, last_reminder_sent=datetime.now())
+        now = datetime.now()
+        with self._lock:
+            state = self.blog_states.get(blog_name)
+            if state:
+                seen_url_hashes = state.with_seen_url(post.url)
+            else:
+                seen_url_hashes = [url_hash(post.url)] if post.url else []
+            self.update_blog_state(
+                blog_name,
+                last_post_title=post.title,
+                last_post_url=post.url,
+                last_post_guid=post.guid,
+                last_check=now,
+                last_success=now,
+                seen_url_hashes=seen_url_hashes,
+            )
+
+    def update_last_reminder_sent(self, blog_name: str, now: Optional[datetime] = None) -> None:
+        """Update the last reminder sent timestamp for a blog (defaults to now)."""
+        self.update_blog_state(blog_name, last_reminder_sent=now or datetime.now())
+
+    def update_page_validators(
+        self, blog_name: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        """Record the blog page's ETag/Last-Modified for conditional requests."""
+        self.update_blog_state(blog_name, page_etag=etag, page_last_modified=last_modified)
 
     def increment_failure_count(self, blog_name: str, url: str = "") -> None:
         """Increment failure count for a blog."""
-        current_state = self.get_blog_state(blog_name)
-        failure_count = (current_state.failure_count + 1) if current_state else 1
-
-        self.update_blog_state(
-            blog_name, url=url, failure_count=failure_count, last_check=datetime.now()
-        )
+        with self._lock:
+            current_state = self.blog_states.get(blog_name)
+            if current_state is None:
+                self.update_blog_state(
+                    blog_name, url=url, failure_count=1, last_check=datetime.now()
+                )
+                return
+
+            # Mutate in place rather than going through update_blog_state's kwargs loop
+            current_state.url = url
+            current_state.failure_count += 1
+            current_state.last_check = datetime.now()
 
     def reset_failure_count(self, blog_name: str) -> None:
         """Reset failure count for a blog."""
@@ -177,10 +252,10 @@ class BlogStorage:
 
         return reminder_needed
 
-    def mark_reminder_sent(self, blog_name: str) -> None:
-        """Mark that a reminder was sent for a problematic blog."""
+    def mark_reminder_sent(self, blog_name: str, now: Optional[datetime] = None) -> None:
+        """Mark that a reminder was sent for a problematic blog (defaults to now)."""
         if blog_name in self.blog_states:
-            self.blog_states[blog_name].last_reminder_sent = datetime.now()
+            self.blog_states[blog_name].last_reminder_sent = now or datetime.now()
 
     def mark_as_problematic(self, blog_name: str, is_problematic: bool = True) -> None:
         """Mark a blog as problematic (or unmark it)."""
@@ -197,7 +272,8 @@ class BlogStorage:
         Returns:
             True if blog was found and removed, False otherwise
         """
-        if blog_name in self.blog_states:
-            del self.blog_states[blog_name]
-            return True
-        return False
+        with self._lock:
+            if blog_name in self.blog_states:
+                del self.blog_states[blog_name]
+                return True
+            return False
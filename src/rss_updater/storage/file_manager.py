@@ -1,48 +1,78 @@
 """File management for blog storage."""
 
 import json
+import os
 import shutil
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+
+from ..utils import read_json
+from ..utils.json_io import dumps
 
 
 class FileManager:
     """Handles file operations for blog storage."""
 
+    # Previous versions kept as .json.bak, .json.bak.1, ..., newest first
+    BACKUP_COUNT = 3
+
     def __init__(self, storage_path: Path):
         self.storage_path = storage_path
+        # Set when the last load fell back to a backup; the primary file needs rewriting
+        self.recovered = False
+
+    def _backup_paths(self) -> List[Path]:
+        """Backup file paths, newest first."""
+        return [self.storage_path.with_suffix(".json.bak")] + [
+            self.storage_path.with_suffix(f".json.bak.{i}") for i in range(1, self.BACKUP_COUNT)
+        ]
 
     def load_data(self) -> Dict:
-        """Load blog states from JSON file."""
+        """Load blog states from JSON file, falling back to the newest readable backup."""
+        self.recovered = False
         if not self.storage_path.exists():
             return {}
 
         try:
-            with open(self.storage_path, "r") as f:
-                return json.load(f)
+            return read_json(self.storage_path)
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in storage file {self.storage_path}: {e}")
             self._create_backup()
-            return {}
+            self.recovered = True
+            return self._load_from_backups()
         except Exception as e:
             print(f"Warning: Failed to load storage file {self.storage_path}: {e}")
             return {}
 
+    def _load_from_backups(self) -> Dict:
+        """Return the newest backup that parses, or {} if none does."""
+        for backup_path in self._backup_paths():
+            if not backup_path.exists():
+                continue
+            try:
+                data = read_json(backup_path)
+            except (OSError, json.JSONDecodeError):
+                continue
+            print(f"Recovered blog states from backup: {backup_path}")
+            return data
+        return {}
+
     def save_data(self, data: Dict) -> None:
         """Save data to JSON file with automatic backup."""
         # Create backup before writing if file exists
         if self.storage_path.exists():
-            backup_path = self.storage_path.with_suffix(".json.bak")
-            shutil.copy2(self.storage_path, backup_path)
+            self._rotate_backups()
 
         try:
             # Write to temporary file first, then rename for atomic operation
             temp_path = self.storage_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(temp_path, "wb") as f:
+                f.write(dumps(data, indent=True))
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic rename
-            temp_path.rename(self.storage_path)
+            os.replace(temp_path, self.storage_path)
 
         except Exception as e:
             print(f"Error saving storage file: {e}")
@@ -52,6 +82,20 @@ class FileManager:
                 temp_path.unlink()
             raise
 
+    def _rotate_backups(self) -> None:
+        """Shift existing backups down the ring and back up the current file."""
+        backups = self._backup_paths()
+        for older, newer in zip(reversed(backups), reversed(backups[:-1])):
+            if newer.exists():
+                os.replace(newer, older)
+
+        # The rename in save_data gives the live file a new inode, so a hard link keeps the old one
+        backups[0].unlink(missing_ok=True)
+        try:
+            os.link(self.storage_path, backups[0])
+        except OSError:
+            shutil.copy2(self.storage_path, backups[0])
+
     def _create_backup(self) -> None:
         """Create backup of corrupted storage file."""
         if self.storage_path.exists():
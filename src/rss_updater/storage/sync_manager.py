@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict
 from .blog_state import BlogState
 from ..constants import BLOGS_CONFIG_PATH, LEGACY_BLOGS_PATH
+from ..utils import read_json
 
 
 class SyncManager:
@@ -37,8 +38,7 @@ class SyncManager:
 
         # Load blogs configuration
         try:
-            with open(blogs_config_path, "r") as f:
-                blogs_config = json.load(f)
+            blogs_config = read_json(blogs_config_path)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in blogs config file: {e}")
 
@@ -52,25 +52,24 @@ class SyncManager:
         config_blogs = {blog["name"]: blog["url"] for blog in blogs_config}
 
         # Remove blogs that are no longer in config
-        current_blog_names = list(blog_states.keys())
-        for blog_name in current_blog_names:
-            if blog_name not in config_blogs:
-                del blog_states[blog_name]
-                removed_blogs.append(blog_name)
+        for blog_name in sorted(blog_states.keys() - config_blogs.keys()):
+            del blog_states[blog_name]
+            removed_blogs.append(blog_name)
 
         # Add new blogs and update existing ones
-        for blog in blogs_config:
-            blog_name = blog["name"]
-            blog_url = blog["url"]
-
-            if blog_name in blog_states:
+        for blog_name, blog_url in config_blogs.items():
+            current_state = blog_states.get(blog_name)
+            if current_state is not None:
                 # Check if URL changed
-                current_state = blog_states[blog_name]
                 if current_state.url != blog_url:
                     # URL changed - update it and reset post data since it's a different source
                     current_state.url = blog_url
                     current_state.last_post_title = None
+                    current_state.last_post_fingerprint = None
                     current_state.last_post_url = None
+                    current_state.last_post_guid = None
+                    current_state.page_etag = None
+                    current_state.page_last_modified = None
                     current_state.failure_count = 0
                     updated_blogs.append(f"{blog_name} (URL: {blog_url})")
             else:
@@ -1,5 +1,27 @@
 """Utility functions."""
 
-from .utils import clean_text, resolve_relative_url, get_domain
+from .utils import (
+    clean_text,
+    content_hash,
+    get_domain,
+    group_by_host,
+    post_fingerprint,
+    resolve_relative_url,
+    url_hash,
+)
+from .log_config import configure_logging
+from .json_io import read_json, read_json_cached, write_json
 
-__all__ = ["clean_text", "resolve_relative_url", "get_domain"]
+__all__ = [
+    "clean_text",
+    "content_hash",
+    "resolve_relative_url",
+    "get_domain",
+    "group_by_host",
+    "post_fingerprint",
+    "url_hash",
+    "configure_logging",
+    "read_json",
+    "read_json_cached",
+    "write_json",
+]
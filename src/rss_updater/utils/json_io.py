@@ -0,0 +1,60 @@
+"""JSON reading and writing, using orjson when it is installed."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json produces the same output
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def read_json_cached(path: Path) -> Any:
+    """
+    Read a JSON file, reusing the parsed result while the file's mtime is unchanged.
+
+    The result is shared between callers, so objects come back read-only:
+    dicts as MappingProxyType and lists as tuples.
+    """
+    path = Path(path)
+    return _read_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_json_cached(path: str, mtime_ns: int) -> Any:
+    return _freeze(read_json(path))
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def write_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """Serialize an object and write it to a JSON file."""
+    Path(path).write_bytes(dumps(obj, indent=indent))
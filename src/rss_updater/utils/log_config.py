@@ -0,0 +1,27 @@
+"""Logging setup for command-line runs."""
+
+import logging
+import sys
+from typing import Optional
+
+_handler: Optional[logging.Handler] = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send package log records straight to stdout.
+
+    The handler writes synchronously, so log lines stay in order with the
+    print() output that the CLI and notifiers still write to stdout.
+    """
+    global _handler
+    if _handler is not None:
+        return
+
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logger = logging.getLogger("rss_updater")
+    logger.addHandler(_handler)
+    logger.setLevel(level)
+    logger.propagate = False
@@ -1,12 +1,19 @@
 """Utility functions for the RSS updater application."""
 
+import hashlib
+import html
 import re
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+from urllib.parse import urljoin, urlparse, urlsplit
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
 
 
 def validate_url(url: str) -> bool:
     """
-    Validate if a string is a proper URL.
+    Validate if a string is a proper http(s) URL.
 
     Args:
         url: The URL string to validate
@@ -14,16 +21,18 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+    if not isinstance(url, str) or not url.startswith(("http://", "https://")):
         return False
 
+    # A host must follow the scheme
+    rest = url.partition("://")[2]
+    return bool(rest) and rest[0] not in "/?#"
 
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """
-    Normalize a URL by removing fragments and ensuring proper format.
+    Normalize a URL by removing fragments, lowercasing the host and ensuring proper format.
 
     Args:
         url: The URL to normalize
@@ -39,8 +48,8 @@ def normalize_url(url: str) -> str:
         url = "https://" + url
 
     # Parse and reconstruct without fragment
-    parsed = urlparse(url)
-    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    parsed = urlsplit(url)
+    normalized = f"{parsed.scheme}://{parsed.netloc.lower()}{parsed.path}"
 
     if parsed.query:
         normalized += f"?{parsed.query}"
@@ -48,6 +57,7 @@ def normalize_url(url: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
 def resolve_relative_url(base_url: str, relative_url: str) -> str:
     """
     Resolve a relative URL against a base URL.
@@ -75,26 +85,21 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove extra whitespace and normalize
-    text = re.sub(r"\s+", " ", text.strip())
-
-    # Remove common unwanted characters
-    text = re.sub(r"[\r\n\t]", " ", text)
+    # Decode HTML entities left in the text (&nbsp; becomes whitespace collapsed below)
+    if "&" in text:
+        text = html.unescape(text)
 
-    # Remove HTML entities (basic ones)
-    html_entities = {
-        "&amp;": "&",
-        "&lt;": "<",
-        "&gt;": ">",
-        "&quot;": '"',
-        "&#39;": "'",
-        "&nbsp;": " ",
-    }
+    # Remove extra whitespace (including \r, \n and \t) and normalize
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
 
-    return text.strip()
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield the pieces of _SENTENCE_END_RE.split(text) lazily."""
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    yield text[start:]
 
 
 def extract_excerpt(text: str, max_length: int = 200) -> str:
@@ -116,11 +121,10 @@ def extract_excerpt(text: str, max_length: int = 200) -> str:
     if len(cleaned) <= max_length:
         return cleaned
 
-    # Try to break at a sentence boundary
-    sentences = re.split(r"[.!?]+", cleaned)
+    # Try to break at a sentence boundary; sentences past the limit are never split out
     excerpt = ""
 
-    for sentence in sentences:
+    for sentence in _iter_sentences(cleaned):
         sentence = sentence.strip()
         if not sentence:
             continue
@@ -141,6 +145,56 @@ def extract_excerpt(text: str, max_length: int = 200) -> str:
     return excerpt
 
 
+def post_fingerprint(title: Optional[str], url: Optional[str]) -> str:
+    """
+    Fingerprint a post by its cleaned title and URL.
+
+    Two posts have the same fingerprint exactly when their cleaned titles and
+    URLs are both equal, so stored posts can be compared without re-cleaning.
+
+    Args:
+        title: Post title (cleaned before hashing)
+        url: Post URL
+
+    Returns:
+        Hex digest of the title/URL pair
+    """
+    key = f"{clean_text(title)}\n{url or ''}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def content_hash(body: bytes) -> str:
+    """
+    Hash a response body so byte-identical pages can be recognized.
+
+    Args:
+        body: Raw response bytes
+
+    Returns:
+        Hex digest of the body
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def url_hash(url: str) -> str:
+    """
+    Hash a post URL for compact seen-URL bookkeeping.
+
+    The URL is normalized and a trailing slash ignored, so trivially different
+    spellings of the same permalink hash alike.
+
+    Args:
+        url: Post URL
+
+    Returns:
+        16-character hex digest
+    """
+    key = normalize_url(url).rstrip("/")
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=1024)
 def get_domain(url: str) -> str:
     """
     Extract domain from URL.
@@ -156,3 +210,19 @@ def get_domain(url: str) -> str:
         return parsed.netloc.lower()
     except Exception:
         return ""
+
+
+def group_by_host(blogs: Iterable[Mapping[str, str]]) -> Dict[str, List[Mapping[str, str]]]:
+    """
+    Group blog entries by the host of their URL, keeping the original order.
+
+    Args:
+        blogs: Blog entries with a "url" key
+
+    Returns:
+        Mapping of host to the blogs served from it
+    """
+    groups: Dict[str, List[Mapping[str, str]]] = {}
+    for blog in blogs:
+        groups.setdefault(get_domain(blog["url"]), []).append(blog)
+    return groups
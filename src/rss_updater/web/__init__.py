@@ -1,5 +1,12 @@
 """Web scraping functionality."""
 
 from .scraper import WebScraper
+from .session import FEED_BACKOFF_FACTOR, FEED_RETRY_TOTAL, create_session, get_shared_session
 
-__all__ = ["WebScraper"]
+__all__ = [
+    "WebScraper",
+    "create_session",
+    "get_shared_session",
+    "FEED_RETRY_TOTAL",
+    "FEED_BACKOFF_FACTOR",
+]
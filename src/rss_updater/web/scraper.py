@@ -1,109 +1,274 @@
 """Web scraping functionality for the RSS updater application."""
 
+import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
+from urllib.parse import urlsplit
 import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from lxml import etree
+
+from .session import DEFAULT_ACCEPT_ENCODING, get_shared_session
+
+logger = logging.getLogger(__name__)
+
+# Pages larger than this are rejected rather than buffered and parsed
+MAX_BODY_BYTES = 8 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
 
 
 def rate_limit(delay: float = 1.0):
-    """Decorator to add rate limiting between requests."""
+    """
+    Decorator spacing requests to the same host at least `delay` seconds apart.
+
+    Each call reserves the next free slot for its host under a lock and sleeps
+    until then, so requests to different hosts are never delayed by each other.
+    """
 
     def decorator(func):
         @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            if hasattr(self, "_last_request_time"):
-                elapsed = time.time() - self._last_request_time
-                if elapsed < delay:
-                    time.sleep(delay - elapsed)
+        def wrapper(self, url, *args, **kwargs):
+            host = urlsplit(url).netloc
+            with self._rate_lock:
+                now = time.monotonic()
+                start = max(now, self._next_request_time.get(host, now))
+                self._next_request_time[host] = start + delay * self._backoff.get(host, 1.0)
 
-            result = func(self, *args, **kwargs)
-            self._last_request_time = time.time()
-            return result
+            if start > now:
+                time.sleep(start - now)
+            return func(self, url, *args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
+class _TitleFound(Exception):
+    """Raised by _TitleTarget to stop parsing once the title is known."""
+
+
+class _TitleTarget:
+    """lxml parser target that collects <title> text and nothing else."""
+
+    def __init__(self):
+        self.in_title = False
+        self.parts = []
+
+    def start(self, tag, attrib):
+        if tag == "title":
+            self.in_title = True
+        elif tag == "body":
+            # The document title lives in <head>; anything later is not it
+            raise _TitleFound
+
+    def end(self, tag):
+        if tag == "title" and self.in_title:
+            raise _TitleFound
+
+    def data(self, data):
+        if self.in_title:
+            self.parts.append(data)
+
+    def close(self):
+        return None
+
+
+def extract_title(content: bytes) -> Optional[str]:
+    """
+    Extract the page <title> without building a DOM.
+
+    Args:
+        content: Raw HTML bytes
+
+    Returns:
+        Stripped title text or None if the page has none
+    """
+    target = _TitleTarget()
+    parser = etree.HTMLParser(target=target)
+    try:
+        parser.feed(content)
+        parser.close()
+    except _TitleFound:
+        pass
+    except etree.LxmlError:
+        return None
+
+    title = "".join(target.parts).strip()
+    return title or None
+
+
 class WebScraper:
     """Web scraper with session management and error handling."""
 
-    def __init__(self, user_agent: str = "Mozilla/5.0 (Personal RSS Updater)", timeout: int = 30):
-        """Initialize scraper with session and retry strategy."""
-        self.session = requests.Session()
-        self.timeout = timeout
-        self._last_request_time = 0
-
-        # Set user agent
-        self.session.headers.update(
-            {
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-        )
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            raise_on_status=False,  # Don't raise HTTPError, let us handle it
-        )
+    # Per-host multiplier on the rate-limit delay, raised when a host answers 429/503
+    # and eased back towards 1.0 by successful requests
+    BACKOFF_INCREMENT = 1.25
+    BACKOFF_DECREMENT = 0.95
+    MAX_BACKOFF = 16.0
+
+    def __init__(
+        self,
+        user_agent: str = "Mozilla/5.0 (Personal RSS Updater)",
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize scraper with session and retry strategy.
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        Args:
+            user_agent: User-Agent header for requests
+            timeout: Request timeout in seconds
+            session: Optional session; defaults to the process-wide shared session.
+                Either way it is left open on close()
+        """
+        self.session = session or get_shared_session(user_agent)
+        self.timeout = timeout
+        # Earliest time.monotonic() at which each host may be requested again
+        self._next_request_time: Dict[str, float] = {}
+        self._rate_lock = threading.Lock()
+        self._backoff: Dict[str, float] = {}
+
+        # Browser-like headers sent with page requests
+        self.headers = {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        }
 
     @rate_limit(delay=1.0)
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[requests.Response]:
+    def fetch_page(
+        self,
+        url: str,
+        retries: int = 3,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[requests.Response]:
         """
         Fetch a web page with error handling and retry logic.
 
         Args:
             url: The URL to fetch
             retries: Number of retries for connection/timeout errors
+            etag: ETag from a previous fetch, sent as If-None-Match
+            last_modified: Last-Modified from a previous fetch, sent as If-Modified-Since
 
         Returns:
-            Response object or None if failed
+            Response object (status 304 if the page is unchanged) or None if failed
         """
+        headers = self.headers
+        if etag or last_modified:
+            headers = dict(self.headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         for attempt in range(retries):
             try:
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
                 response.raise_for_status()
-                return response
+                self._adjust_backoff(url, throttled=False)
+                return response if self._read_body(response, url) else None
 
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 if attempt == retries - 1:  # Last attempt
                     if isinstance(e, requests.exceptions.Timeout):
-                        print(f"Timeout fetching {url}")
+                        logger.warning("Timeout fetching %s", url)
                     else:
-                        print(f"Connection error fetching {url}")
+                        logger.warning("Connection error fetching %s", url)
                 continue  # Try again
 
             except requests.exceptions.HTTPError as e:
+                # An error Response is falsy, so compare with None
                 status_code = (
-                    getattr(e.response, "status_code", "unknown") if e.response else "unknown"
+                    getattr(e.response, "status_code", "unknown")
+                    if e.response is not None
+                    else "unknown"
                 )
-                print(f"HTTP error {status_code} fetching {url}")
+                if status_code in (429, 503):
+                    self._adjust_backoff(
+                        url, throttled=True, retry_after=e.response.headers.get("Retry-After")
+                    )
+                logger.warning("HTTP error %s fetching %s", status_code, url)
                 return None
             except requests.exceptions.RequestException as e:
-                print(f"Request error fetching {url}: {e}")
+                logger.warning("Request error fetching %s: %s", url, e)
                 return None
             except Exception as e:
-                print(f"Unexpected error fetching {url}: {e}")
+                logger.warning("Unexpected error fetching %s: %s", url, e)
                 return None
 
         return None
 
+    def fetch_many(
+        self, urls: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, Optional[requests.Response]]:
+        """
+        Fetch several pages concurrently.
+
+        Requests to different hosts overlap on a thread pool; the per-host rate
+        limit still spaces out requests to the same host.
+
+        Args:
+            urls: URLs to fetch
+            max_workers: Maximum number of pages fetched at once
+
+        Returns:
+            Mapping of URL to its response (None if the fetch failed), in input order
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.fetch_page, urls)))
+
+    def _read_body(self, response: requests.Response, url: str) -> bool:
+        """
+        Read a streamed response body into response.content, up to MAX_BODY_BYTES.
+
+        Returns:
+            False (with the connection closed) for oversized bodies
+        """
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > MAX_BODY_BYTES:
+            logger.warning("Skipping %s: %s bytes exceeds size limit", url, length)
+            response.close()
+            return False
+
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            body += chunk
+            if len(body) > MAX_BODY_BYTES:
+                logger.warning("Skipping %s: body exceeds %d bytes", url, MAX_BODY_BYTES)
+                response.close()
+                return False
+
+        # Hand the bytes back to requests so .content/.text behave as usual
+        response._content = bytes(body)
+        return True
+
+    def _adjust_backoff(self, url: str, throttled: bool, retry_after: Optional[str] = None) -> None:
+        """Grow the host's rate-limit multiplier after throttling, or ease it after success."""
+        host = urlsplit(url).netloc
+        with self._rate_lock:
+            multiplier = self._backoff.get(host, 1.0)
+            if throttled:
+                self._backoff[host] = min(self.MAX_BACKOFF, multiplier * self.BACKOFF_INCREMENT)
+                # Honour a numeric Retry-After by holding the host's next slot until then
+                if retry_after and retry_after.strip().isdigit():
+                    not_before = time.monotonic() + int(retry_after)
+                    self._next_request_time[host] = max(
+                        self._next_request_time.get(host, 0.0), not_before
+                    )
+            elif multiplier > 1.0:
+                self._backoff[host] = max(1.0, multiplier * self.BACKOFF_DECREMENT)
+
     def parse_page(self, response: requests.Response) -> Optional[BeautifulSoup]:
         """
         Parse HTML response into BeautifulSoup object.
@@ -115,14 +280,12 @@ class WebScraper:
             BeautifulSoup object or None if parsing failed
         """
         try:
-            # Try to detect encoding from response
-            response.encoding = response.apparent_encoding or "utf-8"
-
+            # Hand lxml the raw bytes; BeautifulSoup sniffs the charset itself
             soup = BeautifulSoup(response.content, "lxml")
             return soup
 
         except Exception as e:
-            print(f"Error parsing HTML: {e}")
+            logger.warning("Error parsing HTML: %s", e)
             return None
 
     def fetch_and_parse(self, url: str) -> Optional[BeautifulSoup]:
@@ -141,12 +304,37 @@ class WebScraper:
 
         return self.parse_page(response)
 
-    def get_page_info(self, url: str) -> Dict[str, Any]:
+    def fetch_title_only(self, url: str) -> Optional[str]:
+        """
+        Fetch a web page and return just its title.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Page title or None if the fetch failed or the page has no title
+        """
+        response = self.fetch_page(url)
+        if response is None:
+            return None
+
+        return extract_title(response.content)
+
+    @rate_limit(delay=1.0)
+    def _head(self, url: str) -> requests.Response:
+        """Send a HEAD request for url, following redirects."""
+        return self.session.head(
+            url, headers=self.headers, timeout=self.timeout, allow_redirects=True
+        )
+
+    def get_page_info(self, url: str, with_title: bool = True) -> Dict[str, Any]:
         """
         Get basic information about a web page.
 
         Args:
             url: The URL to analyze
+            with_title: Download the body for the title; if False only a HEAD request is
+                sent and page_size comes from Content-Length (None if absent)
 
         Returns:
             Dictionary with page information
@@ -161,6 +349,14 @@ class WebScraper:
         }
 
         try:
+            if not with_title:
+                response = self._head(url)
+                length = response.headers.get("content-length", "")
+                info["status_code"] = response.status_code
+                info["content_type"] = response.headers.get("content-type", "unknown")
+                info["page_size"] = int(length) if length.isdigit() else None
+                return info
+
             response = self.fetch_page(url)
             if response is None:
                 info["error"] = "Failed to fetch page"
@@ -170,11 +366,8 @@ class WebScraper:
             info["content_type"] = response.headers.get("content-type", "unknown")
             info["page_size"] = len(response.content)
 
-            soup = self.parse_page(response)
-            if soup:
-                title_tag = soup.find("title")
-                if title_tag:
-                    info["title"] = title_tag.get_text().strip()
+            # Only the title is needed, so skip building the full soup
+            info["title"] = extract_title(response.content)
 
         except Exception as e:
             info["error"] = str(e)
@@ -182,8 +375,7 @@ class WebScraper:
         return info
 
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Nothing to release; the session is shared and stays open for reuse."""
 
     def __enter__(self):
         """Context manager entry."""
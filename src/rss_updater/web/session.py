@@ -0,0 +1,78 @@
+"""Shared HTTP session setup."""
+
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# "gzip, deflate" plus "br"/"zstd" when urllib3 can decode them (brotli / zstd extras)
+DEFAULT_ACCEPT_ENCODING = ACCEPT_ENCODING.replace(",", ", ")
+
+# Lighter retry policy for feed fetches: a feed that fails is retried on the next run,
+# and the page-scraping fallback should not wait out a long backoff first
+FEED_RETRY_TOTAL = 2
+FEED_BACKOFF_FACTOR = 0.3
+
+_shared_sessions: Dict[str, requests.Session] = {}
+_shared_lock = threading.Lock()
+
+
+def create_session(
+    user_agent: str = "Mozilla/5.0 (Personal RSS Updater)",
+    pool_maxsize: int = 10,
+    pool_connections: int = 50,
+    retry_total: int = 3,
+    backoff_factor: float = 1,
+) -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries.
+
+    Args:
+        user_agent: User-Agent header sent with every request
+        pool_maxsize: Connections kept open per host (requests' default; callers running
+            concurrent workers size it to their worker count)
+        pool_connections: Hosts whose pools are kept (requests' default of 10 would
+            evict keep-alive connections on a blog list spanning more hosts)
+        retry_total: Retries for connection errors and 429/5xx responses
+        backoff_factor: urllib3 backoff factor between retries
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": user_agent, "Accept-Encoding": DEFAULT_ACCEPT_ENCODING})
+
+    retry_strategy = Retry(
+        total=retry_total,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        raise_on_status=False,  # Don't raise HTTPError, let callers handle it
+    )
+
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy, pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def get_shared_session(user_agent: str = "Mozilla/5.0 (Personal RSS Updater)") -> requests.Session:
+    """
+    Return a process-wide session for the given User-Agent, creating it on first use.
+
+    Scrapers created without an explicit session share it, so short-lived
+    WebScraper contexts (e.g. in diagnostics) keep their TCP/TLS connections.
+    Callers must not close it.
+    """
+    with _shared_lock:
+        session = _shared_sessions.get(user_agent)
+        if session is None:
+            session = create_session(user_agent, pool_maxsize=50)
+            _shared_sessions[user_agent] = session
+        return session
@@ -3,8 +3,11 @@
 import pytest
 from bs4 import BeautifulSoup
 
+from rss_updater.core.models import DetectedPost
+
 from rss_updater.detection.detector import SelectorDetector
 from rss_updater.detection.post_extractor import PostExtractor
+from rss_updater.utils import post_fingerprint
 
 
 class TestContentDetectionEdgeCases:
@@ -62,7 +65,7 @@ class TestContentDetectionEdgeCases:
         selectors = detector.detect_post_selectors(soup, "https://example.com")
 
         # Should return empty or very low confidence selectors
-        assert len(selectors) == 0 or all(sel["confidence"] < 0.5 for sel in selectors)
+        assert len(selectors) == 0 or all(sel.confidence < 0.5 for sel in selectors)
 
     def test_selector_returns_no_elements(self):
         """Test post extraction when selector finds no elements."""
@@ -164,6 +167,69 @@ class TestContentDetectionEdgeCases:
         assert "🚀" in title
         assert "&amp;" not in title  # Should be decoded to &
 
+    def test_manual_selector_returns_detected_post(self):
+        """Test manual selectors produce a DetectedPost with full confidence."""
+        extractor = PostExtractor()
+
+        html = '<div class="post"><h2>A reasonably long title</h2><a href="/p1">x</a></div>'
+        soup = BeautifulSoup(html, "html.parser")
+        config = {"post_container": ".post", "title_selector": "h2", "link_selector": "a"}
+
+        post = extractor.extract_with_manual_selectors(soup, "https://example.com", config)
+        assert post.title == "A reasonably long title"
+        assert post.url == "https://example.com/p1"
+        assert post.confidence == 1.0
+        assert DetectedPost.from_dict(post.to_dict()) == post
+
+    def test_detection_key_tracks_manual_selectors(self, tmp_path):
+        """Test editing a blog's manual selectors changes its detection key."""
+        selectors_file = tmp_path / "manual_selectors.json"
+        url = "https://example.com/blog"
+
+        before = SelectorDetector(selectors_file).detection_key(url, "Blog")
+        selectors_file.write_text('{"Blog": {"post_container": ".post"}}')
+        after = SelectorDetector(selectors_file).detection_key(url, "Blog")
+
+        assert before != after
+        assert SelectorDetector(selectors_file).detection_key(url, "Other") == before
+
+    def test_platform_selectors_for_hosted_blogs(self, tmp_path):
+        """Test hosted platform markup is read without automatic detection."""
+        detector = SelectorDetector(tmp_path / "missing.json")
+
+        html = """
+        <div class="post-preview">
+            <a class="post-preview-title" href="/p/latest-issue">The latest newsletter issue</a>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        post = detector.get_latest_post(soup, "https://someone.substack.com/")
+        assert post.title == "The latest newsletter issue"
+        assert post.url == "https://someone.substack.com/p/latest-issue"
+        assert detector._get_platform_selector("https://example.com/") is None
+
+    def test_platform_selectors_defer_to_stored_post(self, tmp_path):
+        """Test a blog already tracked by automatic detection keeps its detected post."""
+        detector = SelectorDetector(tmp_path / "missing.json")
+
+        html = """
+        <div class="post-preview">
+            <a class="post-preview-title" href="/p/pinned">A pinned welcome post</a>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        url = "https://someone.substack.com/"
+
+        platform_post = detector.get_latest_post(soup, url)
+        matching = post_fingerprint(platform_post.title, platform_post.url)
+        assert detector.get_latest_post(soup, url, last_post_fingerprint=matching) == platform_post
+
+        stored = post_fingerprint("An older post", "https://someone.substack.com/p/older")
+        # Automatic detection decides instead, as it did before the platform table
+        post = detector.get_latest_post(soup, url, last_post_fingerprint=stored)
+        assert post.selector == "div.post-preview"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
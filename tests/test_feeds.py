@@ -1,7 +1,7 @@
 """Tests for RSS/Atom feed functionality."""
 
 from unittest.mock import Mock, patch
-from datetime import datetime
+from datetime import datetime, timezone
 
 from rss_updater.feeds import FeedDetector, FeedParser, FeedValidator
 from rss_updater.feeds.models import Feed, FeedEntry
@@ -128,6 +128,66 @@ class TestFeedParser:
         assert feed.feed_type == "rss"
         assert len(feed.entries) == 1
         assert feed.entries[0].title == "Test Post"
+        assert feed.latest_entry().title == "Test Post"
+        assert feed.entries[0].published == datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    @patch("rss_updater.feeds.parser.feedparser.parse")
+    def test_parse_feed_skips_entries_without_absolute_link(self, mock_parse):
+        """Test entries without an http(s) link are dropped."""
+        from types import SimpleNamespace
+
+        def make_entry(data):
+            entry = SimpleNamespace(**data)
+            entry.get = lambda key, default=None: data.get(key, default)
+            return entry
+
+        feed_data = {"title": "Test Blog", "link": "https://example.com"}
+        mock_feed = SimpleNamespace(**feed_data)
+        mock_feed.get = lambda key, default=None: feed_data.get(key, default)
+
+        mock_parse.return_value = SimpleNamespace(
+            status=200,
+            bozo=False,
+            feed=mock_feed,
+            entries=[
+                make_entry({"title": "Relative", "link": "/post"}),
+                make_entry({"title": "Missing"}),
+                make_entry({"title": "Absolute", "link": "https://example.com/post"}),
+            ],
+            version="atom10",
+        )
+
+        feed = FeedParser().parse_feed("https://example.com/feed.xml")
+
+        assert [entry.title for entry in feed.entries] == ["Absolute"]
+
+    def test_parse_feed_with_shared_session(self):
+        """Test feeds fetched through a shared session keep caching headers."""
+        session = Mock()
+        session.get.return_value = Mock(
+            status_code=200,
+            url="https://example.com/feed.xml",
+            content=(
+                b'<rss version="2.0"><channel><title>Test Blog</title>'
+                b"<link>https://example.com</link><item><title>Post</title>"
+                b"<link>https://example.com/post</link></item></channel></rss>"
+            ),
+            headers={
+                "Content-Type": "application/rss+xml",
+                "ETag": '"abc"',
+                "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT",
+            },
+        )
+
+        parser = FeedParser(session=session)
+        feed = parser.parse_feed("https://example.com/feed.xml", etag='"old"')
+
+        request_headers = session.get.call_args.kwargs["headers"]
+        assert request_headers["If-None-Match"] == '"old"'
+        assert feed.title == "Test Blog"
+        assert feed.etag == '"abc"'
+        assert feed.modified == datetime(2024, 1, 1, 12, 0, 0)
+        assert feed.entries[0].link == "https://example.com/post"
 
     @patch("rss_updater.feeds.parser.feedparser.parse")
     def test_parse_feed_http_error(self, mock_parse):
@@ -169,8 +229,8 @@ class TestFeedValidator:
         assert health.errors == []
         assert health.warnings == []
 
-    @patch("rss_updater.feeds.validator.requests.get")
-    @patch("rss_updater.feeds.validator.FeedParser.parse_feed")
+    @patch("rss_updater.feeds.validator.requests.Session.get")
+    @patch("rss_updater.feeds.validator.FeedParser.parse_feed_bytes")
     def test_validate_feed_success(self, mock_parse_feed, mock_get):
         """Test successful feed validation."""
         # Mock HTTP response
@@ -200,7 +260,11 @@ class TestFeedValidator:
         assert health.feed_type == "rss"
         assert health.etag == "test-etag"
 
-    @patch("rss_updater.feeds.validator.requests.get")
+        # The body from the single GET is parsed; the feed is not fetched twice
+        assert mock_get.call_count == 1
+        assert mock_parse_feed.call_args.args[0] is mock_response.content
+
+    @patch("rss_updater.feeds.validator.requests.Session.get")
     def test_validate_feed_connection_error(self, mock_get):
         """Test feed validation with connection error."""
         from requests.exceptions import ConnectionError
@@ -215,6 +279,74 @@ class TestFeedValidator:
         assert len(health.errors) > 0
         assert "Connection error" in health.errors[0]
 
+    @patch("rss_updater.feeds.validator.requests.Session.get")
+    @patch("rss_updater.feeds.validator.FeedParser.parse_feed_bytes")
+    def test_validate_feed_not_modified(self, mock_parse_feed, mock_get):
+        """Test a 304 response is treated as valid without parsing the feed."""
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        validator = FeedValidator()
+        health = validator.validate_feed(
+            "https://example.com/feed.xml",
+            etag="test-etag",
+            last_modified="Mon, 01 Jan 2024 12:00:00 GMT",
+        )
+
+        request_headers = mock_get.call_args.kwargs["headers"]
+        assert request_headers["If-None-Match"] == "test-etag"
+        assert request_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+        assert health.is_reachable and health.is_valid
+        assert health.etag == "test-etag"
+        mock_parse_feed.assert_not_called()
+
+    def test_check_feed_quality_warnings(self):
+        """Test the quality pass reports missing dates, bodies and duplicate GUIDs."""
+        from rss_updater.feeds.validator import FeedHealth
+
+        feed = Feed(
+            title="Test Blog",
+            link="https://example.com",
+            entries=[
+                FeedEntry(title="A", link="https://example.com/a", guid="1"),
+                FeedEntry(title="B", link="https://example.com/b", guid="1"),
+                FeedEntry(
+                    title="C",
+                    link="https://example.com/c",
+                    description="Body",
+                    published=datetime(2000, 1, 1),
+                ),
+            ],
+        )
+        health = FeedHealth(url="https://example.com/feed.xml", is_valid=True, is_reachable=True)
+
+        FeedValidator()._check_feed_quality(feed, health)
+
+        assert any("days old" in warning for warning in health.warnings)
+        assert "Many entries lack description/content" in health.warnings
+        assert "2 entries lack publication dates" in health.warnings
+        assert "Feed contains duplicate entries" in health.warnings
+
+    def test_validate_feeds_runs_each_url_once(self):
+        """Test concurrent validation returns one result per unique URL."""
+        from rss_updater.feeds.validator import FeedHealth
+
+        validator = FeedValidator()
+        urls = ["https://a.com/feed", "https://b.com/feed", "https://a.com/feed"]
+
+        with patch.object(
+            FeedValidator,
+            "validate_feed",
+            side_effect=lambda url: FeedHealth(url=url, is_valid=True, is_reachable=True),
+        ) as mock_validate:
+            results = validator.validate_feeds(urls)
+
+        assert list(results) == ["https://a.com/feed", "https://b.com/feed"]
+        assert results["https://b.com/feed"].url == "https://b.com/feed"
+        assert mock_validate.call_count == 2
+
     def test_generate_health_report(self):
         """Test health report generation."""
         from rss_updater.feeds.validator import FeedHealth
@@ -250,6 +382,83 @@ class TestFeedValidator:
         assert "BROKEN FEEDS" in report
 
 
+class TestHybridBlogMonitor:
+    """Test hybrid monitor post comparison."""
+
+    def test_is_new_post_uses_guid(self, tmp_path):
+        """Test only matching GUIDs short-circuit the title/URL comparison."""
+        from rss_updater.core import AppConfig, EmailConfig, Post
+        from rss_updater.feeds import HybridBlogMonitor
+        from rss_updater.storage import BlogStorage
+
+        storage = BlogStorage(tmp_path / "states.json")
+        storage.update_blog_state(
+            "Test Blog",
+            url="https://example.com",
+            last_post_title="Old Title",
+            last_post_url="https://example.com/old",
+            last_post_guid="guid-1",
+        )
+        monitor = HybridBlogMonitor(
+            AppConfig(email=EmailConfig(recipient="me@example.com")), storage=storage
+        )
+        state = storage.get_blog_state("Test Blog")
+
+        renamed = Post(
+            title="Edited Title",
+            url="https://example.com/old",
+            blog_name="Test Blog",
+            guid="guid-1",
+        )
+        assert not monitor._is_new_post(renamed, state, method="rss")
+
+        # A regenerated GUID on the same post falls through to the title/URL comparison
+        rotated = Post(
+            title="Old Title", url="https://example.com/old", blog_name="Test Blog", guid="guid-2"
+        )
+        assert not monitor._is_new_post(rotated, state, method="rss")
+
+        fresh = Post(
+            title="New Title", url="https://example.com/new", blog_name="Test Blog", guid="guid-3"
+        )
+        assert monitor._is_new_post(fresh, state, method="rss")
+
+    def test_is_new_post_compares_aware_and_naive_dates(self, tmp_path):
+        """Test an aware feed date is compared with the naive stored date without errors."""
+        from rss_updater.core import AppConfig, EmailConfig, Post
+        from rss_updater.feeds import HybridBlogMonitor
+        from rss_updater.storage import BlogStorage
+
+        storage = BlogStorage(tmp_path / "states.json")
+        storage.update_blog_state(
+            "Test Blog",
+            url="https://example.com",
+            last_post_title="Old Title",
+            last_post_url="https://example.com/old",
+            last_post_date=datetime(2024, 1, 2, 12, 0),
+        )
+        monitor = HybridBlogMonitor(
+            AppConfig(email=EmailConfig(recipient="me@example.com")), storage=storage
+        )
+        state = storage.get_blog_state("Test Blog")
+
+        older = Post(
+            title="Older",
+            url="https://example.com/older",
+            blog_name="Test Blog",
+            published_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        assert not monitor._is_new_post(older, state, method="rss")
+
+        newer = Post(
+            title="Newer",
+            url="https://example.com/newer",
+            blog_name="Test Blog",
+            published_date=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        )
+        assert monitor._is_new_post(newer, state, method="rss")
+
+
 class TestFeedModels:
     """Test feed data models."""
 
@@ -291,3 +500,25 @@ class TestFeedModels:
         str_repr = str(feed)
         assert "Test Blog" in str_repr
         assert "2 entries" in str_repr
+
+    def test_feed_latest_entry(self):
+        """Test latest entry lookup ignores undated entries."""
+        entries = [
+            FeedEntry(title="Undated", link="https://example.com/undated"),
+            FeedEntry(
+                title="Newest",
+                link="https://example.com/newest",
+                published=datetime(2024, 3, 1),
+            ),
+            FeedEntry(
+                title="Older",
+                link="https://example.com/older",
+                published=datetime(2024, 1, 1),
+            ),
+        ]
+
+        feed = Feed(title="Test Blog", link="https://example.com", entries=entries)
+        assert feed.latest_entry().title == "Newest"
+
+        empty_feed = Feed(title="Empty", link="https://example.com")
+        assert empty_feed.latest_entry() is None
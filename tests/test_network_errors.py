@@ -110,6 +110,8 @@ class TestNetworkErrorHandling:
         """Test handling of partial content responses."""
         with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
+            mock_response.headers = {}
+            mock_response.iter_content.return_value = [b"<html><body>Partial conte"]
             mock_response.raise_for_status.return_value = None
             mock_response.status_code = 206  # Partial Content
             mock_response.content = b"<html><body>Partial conte"  # Cut off
@@ -144,6 +146,8 @@ class TestNetworkErrorHandling:
         with patch("requests.Session.get") as mock_get:
             # First two calls fail, third succeeds
             mock_response = Mock()
+            mock_response.headers = {}
+            mock_response.iter_content.return_value = [b"<html>Success</html>"]
             mock_response.raise_for_status.return_value = None
             mock_response.status_code = 200
             mock_response.content = b"<html>Success</html>"
@@ -176,6 +180,28 @@ class TestNetworkErrorHandling:
             assert result is None
             scraper.close()
 
+    def test_conditional_request_not_modified(self):
+        """Test stored validators are sent and a 304 response is returned as-is."""
+        with patch("requests.Session.get") as mock_get:
+            mock_response = Mock()
+            mock_response.headers = {}
+            mock_response.iter_content.return_value = []
+            mock_response.status_code = 304
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+
+            scraper = WebScraper()
+            result = scraper.fetch_page(
+                "https://example.com", etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+            )
+
+            assert result.status_code == 304
+            headers = mock_get.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"abc"'
+            assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+            assert "If-None-Match" not in scraper.headers
+            scraper.close()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,47 @@
+"""Tests for email notifications."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from rss_updater.core import AppConfig, EmailConfig
+from rss_updater.core.models import Post
+from rss_updater.notification.content_generator import ContentGenerator
+from rss_updater.notification.email_sender import EmailSender
+
+
+def test_digest_html_escapes_post_fields():
+    """Test post titles, URLs and blog names are HTML-escaped in the digest."""
+    generator = ContentGenerator()
+    post = Post(
+        title="Why <script> tags & friends matter",
+        url="https://example.com/post?a=1&b=2",
+        blog_name='Tom "The Blog"',
+    )
+
+    html = generator.create_html_content([post], {"checked_blogs": 1}, "", datetime(2025, 1, 2))
+
+    assert "Why &lt;script&gt; tags &amp; friends matter" in html
+    assert 'href="https://example.com/post?a=1&amp;b=2"' in html
+    assert "Tom &quot;The Blog&quot;" in html
+    assert "January 02, 2025" in html
+
+
+def test_email_sender_sends_multipart_and_closes_connection():
+    """Test a send logs in, sends a multipart message and quits even if QUIT fails."""
+    config = AppConfig(
+        email=EmailConfig(username="me", password="secret", recipient="me@example.com")
+    )
+
+    with patch("smtplib.SMTP") as mock_smtp:
+        server = mock_smtp.return_value
+        server.quit.side_effect = OSError("connection reset")
+
+        assert EmailSender(config).send_email("Second", "<p>2</p>", "2")
+
+        server.login.assert_called_once_with("me", "secret")
+        server.send_message.assert_called_once()
+        server.close.assert_called_once()
+
+    msg = server.send_message.call_args[0][0]
+    assert msg.get_content_type() == "multipart/alternative"
+    assert msg.get_body(("html",)).get_content() == "<p>2</p>\n"
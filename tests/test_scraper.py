@@ -1,7 +1,19 @@
 """Tests for the scraper module."""
 
-from rss_updater.web.scraper import WebScraper
-from rss_updater.utils.utils import validate_url, normalize_url, clean_text, extract_excerpt
+import io
+import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from rss_updater.web.scraper import MAX_BODY_BYTES, WebScraper, extract_title
+from rss_updater.utils.utils import (
+    validate_url,
+    normalize_url,
+    clean_text,
+    extract_excerpt,
+    group_by_host,
+)
 
 
 def test_url_validation():
@@ -19,6 +31,7 @@ def test_url_normalization():
     assert normalize_url("http://example.com") == "http://example.com"
     assert normalize_url("https://example.com#fragment") == "https://example.com"
     assert normalize_url("https://example.com/path?query=1") == "https://example.com/path?query=1"
+    assert normalize_url("https://Example.COM/Path;v=1") == "https://example.com/Path;v=1"
 
 
 def test_text_cleaning():
@@ -37,6 +50,20 @@ def test_excerpt_extraction():
     assert "test sentence" in excerpt
 
 
+def test_group_by_host():
+    """Test blogs are grouped by host in their original order."""
+    blogs = [
+        {"name": "A", "url": "https://a.substack.com/"},
+        {"name": "B", "url": "https://example.com/blog"},
+        {"name": "C", "url": "https://A.substack.com/archive"},
+    ]
+
+    groups = group_by_host(blogs)
+
+    assert list(groups) == ["a.substack.com", "example.com"]
+    assert [blog["name"] for blog in groups["a.substack.com"]] == ["A", "C"]
+
+
 def test_web_scraper_initialization():
     """Test WebScraper initialization."""
     scraper = WebScraper()
@@ -52,6 +79,123 @@ def test_web_scraper_context_manager():
     # Session should be closed after context exit
 
 
+def test_web_scrapers_share_session():
+    """Test scrapers without an explicit session reuse one pooled session."""
+    with WebScraper() as first, WebScraper() as second:
+        assert first.session is second.session
+    with WebScraper(user_agent="Other Agent") as other:
+        assert other.session is not first.session
+
+
+def test_extract_title():
+    """Test title extraction from raw HTML bytes."""
+    html = b"<html><head><title> Hello &amp; welcome </title></head><body></body></html>"
+    assert extract_title(html) == "Hello & welcome"
+    # Titles inside the body (e.g. SVG) are not the page title
+    assert extract_title(b"<html><body><svg><title>Icon</title></svg></body></html>") is None
+    assert extract_title(b"") is None
+
+
+def test_rate_limit_is_per_host():
+    """Test only repeated requests to the same host wait for the rate limit."""
+    response = Mock(status_code=200, headers={}, **{"iter_content.return_value": []})
+    with WebScraper() as scraper:
+        with (
+            patch.object(scraper.session, "get", return_value=response),
+            patch("rss_updater.web.scraper.time.sleep") as mock_sleep,
+        ):
+            scraper.fetch_page("https://a.example/one")
+            scraper.fetch_page("https://b.example/one")
+            assert not mock_sleep.called
+
+            scraper.fetch_page("https://a.example/two")
+            assert mock_sleep.call_count == 1
+            assert 0 < mock_sleep.call_args[0][0] <= 1.0
+
+
+def test_throttled_host_backs_off():
+    """Test a 429 raises the host's backoff multiplier and later successes ease it."""
+    throttled = requests.Response()
+    throttled.status_code = 429
+    throttled.headers["Retry-After"] = "5"
+    ok = Mock(status_code=200, headers={}, **{"iter_content.return_value": []})
+    with WebScraper() as scraper:
+        with (
+            patch.object(scraper.session, "get", return_value=throttled),
+            patch("rss_updater.web.scraper.time.sleep"),
+        ):
+            assert scraper.fetch_page("https://a.example/one") is None
+        assert scraper._backoff["a.example"] == WebScraper.BACKOFF_INCREMENT
+        assert scraper._next_request_time["a.example"] > time.monotonic() + 4
+
+        with (
+            patch.object(scraper.session, "get", return_value=ok),
+            patch("rss_updater.web.scraper.time.sleep"),
+        ):
+            scraper.fetch_page("https://a.example/two")
+        assert 1.0 <= scraper._backoff["a.example"] < WebScraper.BACKOFF_INCREMENT
+
+
+def test_fetch_many_fetches_each_url_once():
+    """Test fetch_many returns a response per unique URL in input order."""
+    urls = ["https://a.example/", "https://b.example/", "https://a.example/"]
+    with WebScraper() as scraper:
+        with patch.object(scraper, "fetch_page", side_effect=lambda url: url.upper()) as fetch:
+            results = scraper.fetch_many(urls)
+
+    assert list(results) == ["https://a.example/", "https://b.example/"]
+    assert results["https://b.example/"] == "HTTPS://B.EXAMPLE/"
+    assert fetch.call_count == 2
+
+
+def _streamed_response(body: bytes, headers: dict) -> requests.Response:
+    """Build a real Response whose body is read from a byte stream."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def test_fetch_page_caps_body_size():
+    """Test oversized responses are rejected and pages of any content type are read."""
+    small = _streamed_response(b"<html><title>Hi</title></html>", {"Content-Type": "text/html"})
+    huge = _streamed_response(b"x" * (MAX_BODY_BYTES + 1), {"Content-Type": "text/html"})
+    declared = _streamed_response(b"", {"Content-Length": str(MAX_BODY_BYTES + 1)})
+    octet = _streamed_response(b"<html></html>", {"Content-Type": "application/octet-stream"})
+
+    with WebScraper() as scraper:
+        with (
+            patch.object(scraper.session, "get", side_effect=[small, huge, declared, octet]),
+            patch("rss_updater.web.scraper.time.sleep"),
+        ):
+            assert scraper.fetch_page("https://a.example/small").content.startswith(b"<html>")
+            assert scraper.fetch_page("https://a.example/huge") is None
+            assert scraper.fetch_page("https://a.example/declared") is None
+            assert scraper.fetch_page("https://a.example/octet").content == b"<html></html>"
+
+
+def test_get_page_info_without_title_sends_head():
+    """Test metadata-only page info comes from a HEAD request without a body."""
+    head = requests.Response()
+    head.status_code = 200
+    head.headers.update({"Content-Type": "text/html", "Content-Length": "1234"})
+
+    with WebScraper() as scraper:
+        with (
+            patch.object(scraper.session, "head", return_value=head) as mock_head,
+            patch.object(scraper.session, "get") as mock_get,
+        ):
+            info = scraper.get_page_info("https://a.example/", with_title=False)
+
+    assert mock_head.call_args.kwargs["allow_redirects"]
+    assert not mock_get.called
+    assert info["status_code"] == 200
+    assert info["content_type"] == "text/html"
+    assert info["page_size"] == 1234
+    assert info["title"] is None
+
+
 if __name__ == "__main__":
     test_url_validation()
     test_url_normalization()
@@ -1,9 +1,7 @@
 """Tests for blog state consistency and duplicate post detection."""
 
 import pytest
-import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
 
 from rss_updater.core.models import Post
 from rss_updater.storage.blog_state import BlogState
@@ -13,16 +11,12 @@ from rss_updater.storage.blog_storage import BlogStorage
 class TestStateConsistency:
     """Test blog state consistency and duplicate detection."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.storage_path = Path(self.temp_dir.name) / "test_states.json"
+    @pytest.fixture(autouse=True)
+    def storage(self, tmp_path):
+        """Give each test a fresh storage file in pytest's per-test directory."""
+        self.storage_path = tmp_path / "test_states.json"
         self.storage = BlogStorage(self.storage_path)
 
-    def teardown_method(self):
-        """Cleanup test environment."""
-        self.temp_dir.cleanup()
-
     def test_duplicate_post_detection(self):
         """Test that duplicate posts are not reported twice."""
         # Initialize blog state with a post
@@ -184,8 +178,7 @@ class TestStateConsistency:
 
         # Simulate failures
         for i in range(5):
-            state = self.storage.get_blog_state(blog_name)
-            self.storage.update_blog_state(blog_name, failure_count=state.failure_count + 1)
+            self.storage.increment_failure_count(blog_name, "https://example.com")
 
         # Should track failure count correctly
         state = self.storage.get_blog_state(blog_name)
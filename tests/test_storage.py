@@ -1,12 +1,16 @@
 """Tests for the storage module."""
 
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from rss_updater.core.models import Post
 from rss_updater.storage.blog_state import BlogState
 from rss_updater.storage.blog_storage import BlogStorage
+from rss_updater.utils import json_io, post_fingerprint
 
 
 def test_blog_state_serialization():
@@ -31,6 +35,19 @@ def test_blog_state_serialization():
     assert restored_state.failure_count == state.failure_count
 
 
+def test_blog_state_to_dict_cached_until_assignment():
+    """Test BlogState reuses its serialized dict until a field changes."""
+    state = BlogState(blog_name="Test Blog", url="https://example.com", last_check=datetime.now())
+
+    data = state.to_dict()
+    assert state.to_dict() is data
+
+    state.failure_count = 3
+    assert state.to_dict() is not data
+    assert state.to_dict()["failure_count"] == 3
+    assert BlogState.from_dict(state.to_dict()) == state
+
+
 def test_blog_storage_operations():
     """Test basic BlogStorage operations."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -83,6 +100,193 @@ def test_post_operations():
     assert restored_post.excerpt == post.excerpt
 
 
+def test_post_fingerprint_cached_on_state():
+    """Test BlogState keeps the post fingerprint in sync with the stored title and URL."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = BlogStorage(Path(temp_dir) / "test_states.json")
+
+        storage.update_blog_state(
+            "Test Blog",
+            url="https://example.com",
+            last_post_title="A &amp; B",
+            last_post_url="https://example.com/a",
+        )
+        state = storage.get_blog_state("Test Blog")
+        assert state.last_post_fingerprint == post_fingerprint("A & B", "https://example.com/a")
+
+        storage.update_latest_post(
+            "Test Blog", Post(title="  New\n Post ", url="https://example.com/new", blog_name="x")
+        )
+        assert state.last_post_fingerprint == post_fingerprint(
+            "New Post", "https://example.com/new"
+        )
+        assert state.last_post_fingerprint != post_fingerprint("New Post", "https://example.com/a")
+
+
+def test_post_fingerprint_recomputed_on_load():
+    """Test the fingerprint is derived from the stored title and URL, never read from disk."""
+    data = {
+        "blog_name": "Test Blog",
+        "url": "https://example.com",
+        "last_post_title": "Edited title",
+        "last_post_url": "https://example.com/a",
+        "last_post_fingerprint": "stale",
+    }
+    state = BlogState.from_dict(data)
+
+    assert state.last_post_fingerprint == post_fingerprint("Edited title", "https://example.com/a")
+    assert "last_post_fingerprint" not in state.to_dict()
+
+
+def test_latest_posts_recorded_as_seen_urls():
+    """Test recorded post URLs are remembered, bounded, and survive a reload."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_path = Path(temp_dir) / "test_states.json"
+        storage = BlogStorage(storage_path)
+        storage.update_blog_state("Test Blog", url="https://example.com/")
+
+        storage.update_latest_post(
+            "Test Blog", Post(title="A", url="https://example.com/a/", blog_name="Test Blog")
+        )
+        storage.update_latest_post(
+            "Test Blog", Post(title="Untitled", url="https://example.com", blog_name="Test Blog")
+        )
+        state = storage.get_blog_state("Test Blog")
+        assert state.has_seen_url("https://example.com/a#comments")
+        assert not state.has_seen_url("https://example.com/")
+
+        storage.save()
+        assert (
+            BlogStorage(storage_path)
+            .get_blog_state("Test Blog")
+            .has_seen_url("https://example.com/a")
+        )
+
+        for i in range(BlogState.MAX_SEEN_URLS + 1):
+            url = f"https://example.com/p{i}"
+            storage.update_latest_post("Test Blog", Post(title="P", url=url, blog_name="x"))
+        assert len(state.seen_url_hashes) == BlogState.MAX_SEEN_URLS
+        assert not state.has_seen_url("https://example.com/p0")
+
+
+def test_new_blog_state_keeps_all_fields():
+    """Test states created by update_latest_post or update_blog_state keep every field."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = BlogStorage(Path(temp_dir) / "test_states.json")
+
+        storage.update_latest_post(
+            "New Blog", Post(title="A", url="https://x.com/a", blog_name="x")
+        )
+        assert storage.get_blog_state("New Blog").has_seen_url("https://x.com/a")
+
+        sent = datetime(2025, 1, 2)
+        storage.update_blog_state("Reminded Blog", url="https://y.com", last_reminder_sent=sent)
+        assert storage.get_blog_state("Reminded Blog").last_reminder_sent == sent
+
+
+def test_batch_defers_saves():
+    """Test saves inside a batch are written once when the batch exits."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_path = Path(temp_dir) / "test_states.json"
+        storage = BlogStorage(storage_path)
+
+        with storage.batch():
+            storage.update_blog_state("Test Blog", url="https://example.com")
+            storage.save()
+            assert not storage_path.exists()
+
+        assert BlogStorage(storage_path).get_blog_state("Test Blog") is not None
+
+
+def test_save_skips_unchanged_states():
+    """Test saving states identical to the file on disk leaves it untouched."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_path = Path(temp_dir) / "test_states.json"
+        storage = BlogStorage(storage_path)
+        storage.update_blog_state("Test Blog", url="https://example.com")
+        storage.save()
+
+        reloaded = BlogStorage(storage_path)
+        reloaded.save()
+        assert not storage_path.with_suffix(".json.bak").exists()
+
+        reloaded.reset_failure_count("Test Blog")
+        reloaded.update_blog_state("Test Blog", failure_count=1)
+        reloaded.save()
+        backup = BlogStorage(storage_path.with_suffix(".json.bak"))
+        assert backup.get_blog_state("Test Blog").failure_count == 0
+        assert reloaded.get_blog_state("Test Blog").failure_count == 1
+
+
+def test_save_keeps_ring_of_backups():
+    """Test each save shifts older versions through a bounded set of backups."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_path = Path(temp_dir) / "test_states.json"
+        storage = BlogStorage(storage_path)
+        for count in range(5):
+            storage.update_blog_state("Test Blog", url="https://example.com", failure_count=count)
+            storage.save()
+
+        backups = [".json.bak", ".json.bak.1", ".json.bak.2"]
+        counts = [
+            BlogStorage(storage_path.with_suffix(suffix)).get_blog_state("Test Blog").failure_count
+            for suffix in backups
+        ]
+        assert counts == [3, 2, 1]
+        assert not storage_path.with_suffix(".json.bak.3").exists()
+
+
+def test_corrupted_file_recovers_from_backup():
+    """Test a corrupted state file is replaced by the newest readable backup on load."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_path = Path(temp_dir) / "test_states.json"
+        storage = BlogStorage(storage_path)
+        for count in range(3):
+            storage.update_blog_state("Test Blog", url="https://example.com", failure_count=count)
+            storage.save()
+
+        # Newest backup (count 1) is unreadable too, so the older one (count 0) is used
+        storage_path.write_text('{"Test Blog": {"blog_name": ')
+        storage_path.with_suffix(".json.bak").write_text("")
+
+        recovered = BlogStorage(storage_path)
+        assert recovered.get_blog_state("Test Blog").failure_count == 0
+        assert storage_path.with_suffix(".backup").exists()
+
+        # An unchanged save still replaces the corrupt primary file
+        recovered.save()
+        reloaded = BlogStorage(storage_path)
+        assert not reloaded.file_manager.recovered
+        assert reloaded.get_blog_state("Test Blog").failure_count == 0
+
+
+def test_json_io_matches_stdlib_output(monkeypatch):
+    """Test JSON files are byte-identical with and without orjson."""
+    data = {"Blog": {"title": "Café – post", "failure_count": 2, "last_check": None}}
+
+    fast = json_io.dumps(data, indent=True)
+    monkeypatch.setattr(json_io, "orjson", None)
+    assert json_io.dumps(data, indent=True) == fast
+    assert json_io.loads(fast) == data
+
+
+def test_read_json_cached_tracks_mtime():
+    """Test cached JSON reads are reused until the file changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "blogs.json"
+        path.write_text('[{"name": "A", "url": "https://a.example"}]')
+
+        first = json_io.read_json_cached(path)
+        assert json_io.read_json_cached(path) is first
+        assert first[0]["name"] == "A"
+        with pytest.raises(TypeError):
+            first[0]["name"] = "B"
+
+        path.write_text('[{"name": "B", "url": "https://b.example"}]')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert json_io.read_json_cached(path)[0]["name"] == "B"
+
+
 if __name__ == "__main__":
     test_blog_state_serialization()
     test_blog_storage_operations()